@@ -0,0 +1,36 @@
+"""make message wamid index unique
+
+Revision ID: 3c9a7e2f41d8
+Revises: 88b151206c14
+Create Date: 2026-10-17 10:12:41.318204
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c9a7e2f41d8"
+down_revision: Union[str, Sequence[str], None] = "88b151206c14"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index(op.f("ix_messages_wamid"), table_name="messages")
+    op.create_index(
+        op.f("ix_messages_wamid"),
+        "messages",
+        ["wamid"],
+        unique=True,
+        postgresql_where=sa.text("wamid IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_messages_wamid"), table_name="messages")
+    op.create_index(op.f("ix_messages_wamid"), "messages", ["wamid"], unique=False)
@@ -1,4 +1,4 @@
-from .client import MetaClient
+from .client import MetaClient, create_http_client
 from .payloads import MetaPayloadBuilder
 
-__all__ = ["MetaClient", "MetaPayloadBuilder"]
+__all__ = ["MetaClient", "MetaPayloadBuilder", "create_http_client"]
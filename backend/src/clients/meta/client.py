@@ -1,4 +1,8 @@
+import asyncio
+from contextlib import asynccontextmanager, nullcontext
+
 import httpx
+import orjson
 from loguru import logger
 from tenacity import (
     retry,
@@ -8,6 +12,22 @@ from tenacity import (
 )
 
 
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Shared HTTP client for Graph API calls and media downloads.
+    HTTP/2 multiplexes concurrent requests over a few TLS connections.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=50,
+            keepalive_expiry=60.0,
+        ),
+    )
+
+
 def is_transient_error(exception):
     """Повертає True, якщо помилка тимчасова (мережа або 5xx від сервера)"""
     if isinstance(exception, httpx.HTTPStatusError):
@@ -23,11 +43,17 @@ def is_transient_error(exception):
 
 class MetaClient:
     def __init__(
-        self, client: httpx.AsyncClient, base_url: str = None, token: str = None
+        self,
+        client: httpx.AsyncClient,
+        base_url: str = None,
+        token: str = None,
+        semaphore: asyncio.Semaphore | None = None,
     ):
         self.client = client
         self.base_url = base_url
         self.token = token
+        # Shared across clients to bound concurrent outbound Graph API calls
+        self._semaphore = semaphore or nullcontext()
 
     def _get_headers(self, existing_headers: dict = None):
         headers = existing_headers or {}
@@ -47,11 +73,14 @@ class MetaClient:
         """Send a message to a phone number using Meta Graph API."""
         url = f"{self.base_url}/{phone_id}/messages"
 
-        headers = self._get_headers()
+        headers = self._get_headers({"Content-Type": "application/json"})
         if idempotency_key:
             headers["X-Idempotency-Key"] = idempotency_key
 
-        resp = await self.client.post(url, json=data, headers=headers)
+        async with self._semaphore:
+            resp = await self.client.post(
+                url, content=orjson.dumps(data), headers=headers
+            )
         response_body = resp.text
         logger.info(
             f"Meta API send_message status: {resp.status_code} | URL: {url} | Response: {response_body}")
@@ -59,7 +88,7 @@ class MetaClient:
         if resp.status_code >= 400:
             logger.warning(f"Meta API Error Response: {response_body}")
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
 
     @retry(
         stop=stop_after_attempt(3),
@@ -78,7 +107,10 @@ class MetaClient:
 
         headers = self._get_headers()
 
-        resp = await self.client.post(url, files=files, data=data, headers=headers)
+        async with self._semaphore:
+            resp = await self.client.post(
+                url, files=files, data=data, headers=headers
+            )
         response_body = resp.text
         logger.info(
             f"Meta API upload_media status: {resp.status_code} | URL: {url} | Response: {response_body}")
@@ -86,7 +118,7 @@ class MetaClient:
             logger.warning(f"Meta API Upload Error: {response_body}")
         resp.raise_for_status()
 
-        result = resp.json()
+        result = orjson.loads(resp.content)
         media_id = result.get("id")
 
         if not media_id:
@@ -106,7 +138,7 @@ class MetaClient:
             f"Meta API fetch_account_info response: {resp.status_code} for WABA: {waba_id} | Response: {response_body}"
         )
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
 
     async def fetch_phone_numbers(self, waba_id: str):
         """Fetch WABA phone numbers from Meta Graph API."""
@@ -118,7 +150,7 @@ class MetaClient:
             f"Meta API fetch_phone_numbers response: {resp.status_code} for WABA: {waba_id} | Response: {response_body}"
         )
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
 
     async def get_media_url(self, media_id: str) -> str:
         """Fetch media URL from Meta Graph API."""
@@ -129,19 +161,19 @@ class MetaClient:
             f"Meta API get_media_url response: {resp.status_code} for Media ID: {media_id} | Response: {response_body}"
         )
         resp.raise_for_status()
-        return resp.json().get("url")
+        return orjson.loads(resp.content).get("url")
 
-    async def stream_media_file(self, media_url: str):
-        """Return a generator for streaming reading"""
+    @asynccontextmanager
+    async def download_media_file(self, media_url: str):
+        """Open a streaming download; the body is read on demand by the caller."""
         async with self.client.stream(
             "GET", media_url, headers=self._get_headers()
         ) as response:
             logger.info(
-                f"Meta API stream_media_file response: {response.status_code} for URL: {media_url} | Headers: {dict(response.headers)}"
+                f"Meta API download_media_file response: {response.status_code} for URL: {media_url}"
             )
             response.raise_for_status()
-            async for chunk in response.aiter_bytes():
-                yield chunk
+            yield response
 
     async def fetch_templates(self, waba_id: str):
         """Fetch message template for a WABA account."""
@@ -152,4 +184,4 @@ class MetaClient:
             f"Meta API fetch_templates response: {resp.status_code} for WABA: {waba_id} | Response: {response_body}"
         )
         resp.raise_for_status()
-        return resp.json()
+        return orjson.loads(resp.content)
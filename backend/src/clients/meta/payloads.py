@@ -1,3 +1,12 @@
+# Fields shared by every outbound message; spread into each payload
+_BASE_PAYLOAD = {
+    "messaging_product": "whatsapp",
+    "recipient_type": "individual",
+}
+
+_CAPTION_MEDIA_TYPES = frozenset({"image", "video", "document"})
+
+
 class MetaPayloadBuilder:
     """Static builder class for constructing Meta API request payloads."""
 
@@ -19,8 +28,7 @@ class MetaPayloadBuilder:
             dict: Meta API payload
         """
         payload = {
-            "messaging_product": "whatsapp",
-            "recipient_type": "individual",
+            **_BASE_PAYLOAD,
             "to": to_phone,
             "type": "text",
             "text": {"body": body},
@@ -67,8 +75,7 @@ class MetaPayloadBuilder:
             ]
 
         payload = {
-            "messaging_product": "whatsapp",
-            "recipient_type": "individual",
+            **_BASE_PAYLOAD,
             "to": to_phone,
             "type": "template",
             "template": template_payload,
@@ -99,8 +106,7 @@ class MetaPayloadBuilder:
             dict: Meta API payload
         """
         payload = {
-            "messaging_product": "whatsapp",
-            "recipient_type": "individual",
+            **_BASE_PAYLOAD,
             "to": to_phone,
             "type": media_type,
             media_type: {
@@ -109,7 +115,7 @@ class MetaPayloadBuilder:
         }
 
         # Add caption if provided and supported by media type
-        if caption and media_type in ["image", "video", "document"]:
+        if caption and media_type in _CAPTION_MEDIA_TYPES:
             payload[media_type]["caption"] = caption
 
         return payload
@@ -132,8 +138,7 @@ class MetaPayloadBuilder:
             dict: Meta API payload
         """
         return {
-            "messaging_product": "whatsapp",
-            "recipient_type": "individual",
+            **_BASE_PAYLOAD,
             "to": to_phone,
             "type": "reaction",
             "reaction": {
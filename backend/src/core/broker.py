@@ -1,9 +1,8 @@
 from faststream.nats import NatsBroker
 
 from src.core.config import settings
-from src.core.logger import setup_logging
+from src.core.logger import logger
 
-logger = setup_logging()
 
 broker = NatsBroker(
     servers=[settings.NATS_URL],
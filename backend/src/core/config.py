@@ -30,6 +30,23 @@ class Settings(BaseSettings):
 
     MAX_CAMPAIGN_RETRIES: int = 2
 
+    # Graph API calls per second per worker (shared AsyncLimiter)
+    META_RATE_PER_SEC: int = 10
+
+    # Concurrent outbound send handlers per worker (Meta rate is capped by the limiter)
+    SEND_WORKERS: int = 10
+
+    # In-flight Graph API send/upload calls per worker, across all handlers
+    META_CONCURRENCY: int = 10
+
+    # Concurrent Meta->R2 media downloads per worker (gains flatten past ~4)
+    MEDIA_DOWNLOAD_CONCURRENCY: int = 4
+
+    # Coalesce concurrently delivered webhooks into one DB pass
+    BULK_RECORDER_ENABLED: bool = False
+    BULK_SIZE: int = 100
+    BULK_FLUSH_MS: int = 50
+
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
     @computed_field
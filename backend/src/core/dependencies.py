@@ -1,7 +1,6 @@
 from typing import AsyncGenerator
 
-import httpx
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.clients.meta import MetaClient
@@ -26,6 +25,7 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
 
 
 async def get_meta_client(
+    request: Request,
     session: AsyncSession = Depends(get_session),
 ) -> AsyncGenerator[MetaClient, None]:
     """Get Meta API client instance with dynamic credentials from DB."""
@@ -41,19 +41,15 @@ async def get_meta_client(
         if hasattr(account, "graph_api_version") and account.graph_api_version:
             base_url = f"https://graph.facebook.com/{account.graph_api_version}"
 
-    async with httpx.AsyncClient(
-        headers={
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        },
-        timeout=30.0,
-    ) as client:
-        yield MetaClient(client=client, base_url=base_url)
+    # Shared pooled client from the lifespan; the token is sent per request
+    yield MetaClient(
+        client=request.app.state.http_client, base_url=base_url, token=token
+    )
 
 
-def get_storage_service() -> StorageService:
+def get_storage_service(request: Request) -> StorageService:
     """Get storage service for media file handling."""
-    return StorageService()
+    return StorageService(s3_client=getattr(request.app.state, "s3", None))
 
 
 def get_notification_service() -> NotificationService:
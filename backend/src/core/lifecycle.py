@@ -4,12 +4,17 @@ from typing import Set
 
 from fastapi import FastAPI
 
+from src.clients.meta import create_http_client
 from src.core.broker import broker, setup_jetstream
 from src.core.database import engine
-from src.core.logger import setup_logging
+from src.core.logger import logger
 from src.core.websocket import nats_listener
+from src.services.media.storage import create_s3_client
+from src.services.notifications.service import (
+    start_notification_dispatcher,
+    stop_notification_dispatcher,
+)
 
-logger = setup_logging()
 
 background_tasks: Set[asyncio.Task] = set()
 
@@ -32,6 +37,19 @@ async def initialize_broker() -> None:
     logger.info("JetStream setup completed")
 
 
+async def initialize_storage(app: FastAPI) -> None:
+    """Open a long-lived R2 client shared by all requests."""
+    app.state.s3_context = create_s3_client()
+    app.state.s3 = await app.state.s3_context.__aenter__()
+    logger.info("R2 storage client initialized")
+
+
+async def initialize_http_client(app: FastAPI) -> None:
+    """Open a long-lived HTTP client for Meta API calls."""
+    app.state.http_client = create_http_client()
+    logger.info("HTTP client initialized")
+
+
 async def shutdown_background_tasks() -> None:
     """Cancel and cleanup all background tasks."""
     for task in background_tasks:
@@ -49,6 +67,22 @@ async def shutdown_broker() -> None:
     logger.info("NATS broker disconnected")
 
 
+async def shutdown_storage(app: FastAPI) -> None:
+    """Close the shared R2 client."""
+    s3_context = getattr(app.state, "s3_context", None)
+    if s3_context:
+        await s3_context.__aexit__(None, None, None)
+    logger.info("R2 storage client closed")
+
+
+async def shutdown_http_client(app: FastAPI) -> None:
+    """Close the shared HTTP client."""
+    http_client = getattr(app.state, "http_client", None)
+    if http_client:
+        await http_client.aclose()
+    logger.info("HTTP client closed")
+
+
 async def shutdown_database() -> None:
     """Dispose database engine."""
     await engine.dispose()
@@ -71,10 +105,16 @@ async def lifespan(app: FastAPI):
 
     await start_websocket_listener()
     await initialize_broker()
+    await initialize_storage(app)
+    await initialize_http_client(app)
+    start_notification_dispatcher()
 
     yield
 
     logger.info("Lifespan: Shutting down...")
+    await stop_notification_dispatcher()
     await shutdown_background_tasks()
     await shutdown_broker()
+    await shutdown_storage(app)
+    await shutdown_http_client(app)
     await shutdown_database()
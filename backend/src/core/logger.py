@@ -5,7 +5,16 @@ from loguru import logger
 from src.core.config import settings
 
 
+_configured = False
+
+
 def setup_logging():
+    """Configure loguru sinks once per process; modules import `logger` directly."""
+    global _configured
+    if _configured:
+        return logger
+    _configured = True
+
     logger.remove()
 
     if settings.DEBUG:
@@ -1,6 +1,6 @@
 import asyncio
-import json
 
+import orjson
 from fastapi import WebSocket
 from loguru import logger
 
@@ -24,7 +24,10 @@ class ConnectionManager:
             logger.info("WebSocket client disconnected")
 
     async def broadcast(self, message: dict):
-        data = json.dumps(message, default=str)
+        await self.broadcast_text(orjson.dumps(message, default=str).decode())
+
+    async def broadcast_text(self, data: str):
+        """Send already-encoded JSON to every client."""
         for connection in list(self.active_connections):
             try:
                 await connection.send_text(data)
@@ -68,15 +71,20 @@ async def nats_listener():
                 try:
                     messages = await psub.fetch(batch=1, timeout=1.0)
                     for msg in messages:
+                        # No dashboard connected: drop the update unparsed
+                        if not manager.active_connections:
+                            await msg.ack()
+                            continue
                         try:
-                            payload = json.loads(msg.data.decode())
+                            # Parse only for the log line; forward the original JSON
+                            payload = orjson.loads(msg.data)
                             event_name = (
                                 payload.get("event") or payload.get("type") or "unknown"
                             )
                             logger.info(f"WS sending: {event_name}")
-                            await manager.broadcast(payload)
+                            await manager.broadcast_text(msg.data.decode())
                             await msg.ack()
-                        except json.JSONDecodeError:
+                        except orjson.JSONDecodeError:
                             logger.error(f"Failed to decode NATS message: {msg.data}")
                             await msg.ack()
                         except Exception as e:
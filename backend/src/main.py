@@ -6,6 +6,7 @@ from src.core.config import settings
 from src.core.exceptions import BaseException
 from src.core.handlers import global_exception_handler, local_exception_handler
 from src.core.lifecycle import lifespan
+from src.core.logger import setup_logging
 from src.routes import (
     campaigns,
     contacts,
@@ -26,6 +27,8 @@ if settings.SENTRY_DSN:
         enable_logs=True,
     )
 
+setup_logging()
+
 app = FastAPI(lifespan=lifespan)
 
 app.add_exception_handler(BaseException, local_exception_handler)
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.database import Base
@@ -45,9 +45,17 @@ class MediaFile(Base, UUIDMixin):
 
 class Message(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "messages"
+    __table_args__ = (
+        # Outbound PENDING messages have no wamid yet, so the index is partial
+        Index(
+            "ix_messages_wamid",
+            "wamid",
+            unique=True,
+            postgresql_where=text("wamid IS NOT NULL"),
+        ),
+    )
 
-    wamid: Mapped[str | None] = mapped_column(
-        String, index=True, nullable=True)
+    wamid: Mapped[str | None] = mapped_column(String, nullable=True)
 
     waba_phone_id: Mapped[UUID] = mapped_column(
         ForeignKey("waba_phone_numbers.id"))
@@ -35,12 +35,26 @@ class CampaignRepository(BaseRepository[Campaign]):
         result = await self.session.execute(stmt)
         return result.scalars().first()
 
-    async def get_scheduled_campaigns(self, now: datetime) -> list[Campaign]:
-        stmt = select(Campaign).where(
-            Campaign.status == CampaignStatus.SCHEDULED, Campaign.scheduled_at <= now
-        )
+    async def get_scheduled_campaigns(
+        self, now: datetime
+    ) -> tuple[list[Campaign], datetime | None]:
+        """
+        Due SCHEDULED campaigns plus the earliest future scheduled_at,
+        from a single query (there are only ever a handful scheduled).
+        """
+        stmt = select(Campaign).where(Campaign.status == CampaignStatus.SCHEDULED)
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+
+        due: list[Campaign] = []
+        next_at: datetime | None = None
+        for campaign in result.scalars().all():
+            if campaign.scheduled_at is None:
+                continue
+            if campaign.scheduled_at <= now:
+                due.append(campaign)
+            elif next_at is None or campaign.scheduled_at < next_at:
+                next_at = campaign.scheduled_at
+        return due, next_at
 
     async def get_stats_by_id(self, campaign_id: UUID) -> dict | None:
         """
@@ -179,6 +193,19 @@ class CampaignContactRepository(BaseRepository[CampaignContact]):
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_for_send(self, link_id: UUID) -> CampaignContact | None:
+        """
+        Lock the link row for the rest of the transaction.
+        Returns None when another worker is already sending to it.
+        """
+        stmt = (
+            select(CampaignContact)
+            .where(CampaignContact.id == link_id)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().first()
+
     async def get_campaign_contacts(
         self, campaign_id: UUID, limit: int = 100, offset: int = 0
     ) -> list[CampaignContact]:
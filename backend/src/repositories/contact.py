@@ -1,7 +1,9 @@
 from uuid import UUID
 
-from sqlalchemy import desc, func, or_, select
+from sqlalchemy import desc, exists, func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
 from src.models import Contact, ContactStatus, Tag, get_utc_now
 from src.repositories.base import BaseRepository
@@ -28,15 +30,32 @@ class ContactRepository(BaseRepository[Contact]):
         result = await self.session.execute(stmt)
         return result.scalars().first()
 
+    async def exists_by_phone(self, phone_number: str) -> bool:
+        """Quick existence check that does not hydrate a Contact."""
+        stmt = select(exists().where(Contact.phone_number == phone_number))
+        return await self.session.scalar(stmt)
+
     async def get_or_create(self, phone_number: str) -> Contact:
         contact = await self.get_by_phone(phone_number)
-        if not contact:
-            contact = Contact(phone_number=phone_number, custom_data={})
-            self.session.add(contact)
-            await self.session.flush()
+        if contact:
+            return contact
 
-            # Явно завантажуємо теги для нового контакту
-            await self.session.refresh(contact, ["tags"])
+        # INSERT ... ON CONFLICT DO NOTHING RETURNING: one round-trip and no
+        # unique violation when concurrent handlers create the same contact
+        stmt = (
+            pg_insert(Contact)
+            .values(phone_number=phone_number, custom_data={})
+            .on_conflict_do_nothing(index_elements=[Contact.phone_number])
+            .returning(Contact)
+        )
+        result = await self.session.execute(select(Contact).from_statement(stmt))
+        contact = result.scalars().first()
+        if contact is None:
+            # Created by another transaction in the meantime
+            return await self.get_by_phone(phone_number)
+
+        # New contact has no tags; mark the collection loaded to skip a query
+        set_committed_value(contact, "tags", [])
         return contact
 
     async def get_paginated(
@@ -80,7 +99,7 @@ class ContactRepository(BaseRepository[Contact]):
         return list(result.scalars().all())
 
     async def create_manual(self, data: ContactCreate) -> Contact | None:
-        if await self.get_by_phone(data.phone_number):
+        if await self.exists_by_phone(data.phone_number):
             return None
 
         contact = Contact(
@@ -140,9 +159,12 @@ class ContactRepository(BaseRepository[Contact]):
         result = await self.session.execute(stmt)
         return result.scalar() or 0
 
-    async def update_activity(self, phone: str) -> Contact:
+    async def update_activity(
+        self, phone: str, contact: Contact | None = None
+    ) -> Contact:
         """Updates the last activity timestamp of a contact."""
-        contact = await self.get_or_create(phone)
+        if contact is None:
+            contact = await self.get_or_create(phone)
         contact.unread_count += 1
         contact.updated_at = get_utc_now()
         contact.last_message_at = get_utc_now()
@@ -154,14 +176,12 @@ class ContactRepository(BaseRepository[Contact]):
         """Перевіряє чи отримував контакт шаблонні повідомлення."""
         from src.models import Message, MessageDirection
 
-        stmt = select(Message).where(
+        stmt = select(exists().where(
             Message.contact_id == contact_id,
             Message.direction == MessageDirection.OUTBOUND,
             Message.template_id.isnot(None)
-        ).limit(1)
-
-        result = await self.session.execute(stmt)
-        return result.scalars().first() is not None
+        ))
+        return await self.session.scalar(stmt)
 
     async def get_inbound_message_count(self, contact_id: UUID) -> int:
         """Повертає кількість вхідних повідомлень від контакту."""
@@ -3,6 +3,7 @@ from datetime import datetime
 from uuid import UUID
 
 from sqlalchemy import desc, exists, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import selectinload
 
 from src.models import MediaFile, Message, MessageDirection, MessageStatus
@@ -19,6 +20,23 @@ class MessageRepository(BaseRepository[Message]):
         self.session.add(message)
         return message
 
+    async def create_if_absent(self, **kwargs) -> Message | None:
+        """
+        INSERT ... ON CONFLICT (wamid) DO NOTHING RETURNING.
+        Returns None when a message with this wamid already exists.
+        """
+        stmt = (
+            pg_insert(Message)
+            .values(**kwargs)
+            .on_conflict_do_nothing(
+                index_elements=[Message.wamid],
+                index_where=Message.wamid.isnot(None),
+            )
+            .returning(Message)
+        )
+        result = await self.session.execute(select(Message).from_statement(stmt))
+        return result.scalars().first()
+
     async def add_media_file(self, message_id: UUID | str, **kwargs) -> MediaFile:
         media_entry = MediaFile(message_id=message_id, **kwargs)
         self.session.add(media_entry)
@@ -33,6 +51,26 @@ class MessageRepository(BaseRepository[Message]):
         result = await self.session.execute(stmt)
         return result.scalars().first()
 
+    async def get_by_wamids(self, wamids: list[str]) -> dict[str, Message]:
+        """Fetch many messages in one query, keyed by wamid."""
+        if not wamids:
+            return {}
+        stmt = (
+            select(Message)
+            .where(Message.wamid.in_(wamids))
+            .options(selectinload(Message.contact))
+        )
+        result = await self.session.execute(stmt)
+        return {m.wamid: m for m in result.scalars().all()}
+
+    async def get_existing_wamids(self, wamids: list[str]) -> set[str]:
+        """Return the subset of wamids already stored (batch deduplication)."""
+        if not wamids:
+            return set()
+        stmt = select(Message.wamid).where(Message.wamid.in_(wamids))
+        result = await self.session.execute(stmt)
+        return set(result.scalars().all())
+
     async def exists_by_wamid(self, wamid: str) -> bool:
         """Quick check for existence of message (for deduplication)."""
         stmt = select(exists().where(Message.wamid == wamid))
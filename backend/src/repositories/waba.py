@@ -1,6 +1,7 @@
 from uuid import UUID
 
 from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from src.models import WabaAccount, WabaPhoneNumber, get_utc_now
 from src.repositories.base import BaseRepository
@@ -61,6 +62,26 @@ class WabaPhoneRepository(BaseRepository[WabaPhoneNumber]):
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def upsert_many(self, rows: list[dict]) -> None:
+        """
+        One multi-row INSERT ... ON CONFLICT (phone_number_id) DO UPDATE.
+        Conflicting rows get the Meta-owned fields refreshed and are restored.
+        """
+        if not rows:
+            return
+        stmt = pg_insert(WabaPhoneNumber).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[WabaPhoneNumber.phone_number_id],
+            set_={
+                "status": stmt.excluded.status,
+                "quality_rating": stmt.excluded.quality_rating,
+                "messaging_limit_tier": stmt.excluded.messaging_limit_tier,
+                "is_deleted": False,
+                "updated_at": get_utc_now(),
+            },
+        )
+        await self.session.execute(stmt)
+
     async def soft_delete_by_phone_ids(self, phone_ids: list[str]) -> int:
         """Soft delete phone numbers by their phone_number_id. Returns count of deleted phones."""
         if not phone_ids:
@@ -72,15 +93,3 @@ class WabaPhoneRepository(BaseRepository[WabaPhoneNumber]):
         )
         result = await self.session.execute(stmt)
         return result.rowcount
-
-    async def restore_by_phone_ids(self, phone_ids: list[str]) -> int:
-        """Restore soft-deleted phone numbers."""
-        if not phone_ids:
-            return 0
-        stmt = (
-            update(WabaPhoneNumber)
-            .where(WabaPhoneNumber.phone_number_id.in_(phone_ids))
-            .values(is_deleted=False, updated_at=get_utc_now())
-        )
-        result = await self.session.execute(stmt)
-        return result.rowcount
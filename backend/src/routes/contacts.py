@@ -131,8 +131,7 @@ async def import_contacts(
                 continue
 
             # Check duplicate
-            existing = await repo.get_by_phone(phone_digits)
-            if existing:
+            if await repo.exists_by_phone(phone_digits):
                 skipped_count += 1
                 continue
 
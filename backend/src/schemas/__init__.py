@@ -74,7 +74,6 @@ from .webhooks import (
     MetaText,
     MetaValue,
     MetaWebhookPayload,
-    WebhookEvent,
 )
 
 __all__ = [
@@ -122,7 +121,6 @@ __all__ = [
     "WabaSyncResponse",
     # Webhooks
     "MetaAccountReviewUpdate",
-    "WebhookEvent",
     "MetaWebhookPayload",
     "MetaEntry",
     "MetaChange",
@@ -3,10 +3,6 @@ from typing import Any, Literal
 from pydantic import BaseModel, ConfigDict, Field
 
 
-class WebhookEvent(BaseModel):
-    payload: dict[str, Any]
-
-
 class MetaBaseModel(BaseModel):
     model_config = ConfigDict(extra="ignore", populate_by_name=True)
 
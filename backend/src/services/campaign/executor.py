@@ -41,7 +41,8 @@ class CampaignMessageExecutor:
         self, campaign_id: UUID, link_id: UUID, contact_id: UUID
     ) -> bool:
         campaign = await self.campaigns.get_by_id_with_template(campaign_id)
-        contact_link = await self.campaign_contacts.get_by_id(link_id)
+        # Row lock: a redelivered task for the same link is skipped, not re-sent
+        contact_link = await self.campaign_contacts.get_for_send(link_id)
         contact = await self.contacts.get_by_id(contact_id)
 
         if not all([campaign, contact_link, contact]):
@@ -169,7 +170,7 @@ class CampaignMessageExecutor:
 
     async def _handle_failed_message(self, campaign, contact_link, message):
         """Обробка невдачі"""
-        contact_link.message_id = message.id
+        contact_link.message = message
         contact_link.retry_count += 1
         self.session.add(contact_link)
 
@@ -188,7 +189,7 @@ class CampaignMessageExecutor:
     async def _handle_success_message(self, campaign, contact, contact_link, message):
         now = get_utc_now()
 
-        contact_link.message_id = message.id
+        contact_link.message = message
         contact_link.updated_at = now
         self.session.add(contact_link)
 
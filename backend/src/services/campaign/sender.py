@@ -54,10 +54,15 @@ class CampaignSenderService:
         await self.lifecycle.start_campaign(campaign)
 
     async def send_single_message(
-        self, campaign_id: UUID, link_id: UUID, contact_id: UUID
+        self,
+        campaign_id: UUID,
+        link_id: UUID,
+        contact_id: UUID,
+        check_completion: bool = True,
     ) -> bool:
         """Send a single message to a contact as part of a campaign.
         Returns True if sent successfully, False otherwise.
+        Batch callers pass check_completion=False and check once per batch.
         """
         success = False
         try:
@@ -67,7 +72,8 @@ class CampaignSenderService:
             await self.executor.handle_send_failure(campaign_id, link_id, str(e))
             success = False
         finally:
-            await self.lifecycle.check_and_complete_if_done(campaign_id)
+            if check_completion:
+                await self.lifecycle.check_and_complete_if_done(campaign_id)
         return success
 
     async def pause_campaign(self, campaign_id: UUID):
@@ -29,10 +29,12 @@ class CampaignTrackerService:
         self.campaign_contacts = CampaignContactRepository(session)
         self.campaigns = CampaignRepository(session)
 
-    async def handle_reply(self, contact_id: UUID):
+    async def handle_reply(self, contact_id: UUID) -> UUID | None:
         """
         Handle a reply from a contact.
         Identify the relevant campaign and mark it as replied.
+        Does NOT commit: the change is persisted with the incoming message.
+        Returns the campaign ID to pass to notify_progress after the commit.
         """
         # Find the most recent campaign sent to this contact
         # We look for campaign contacts where is_replied is False
@@ -55,19 +57,21 @@ class CampaignTrackerService:
         
         if not campaign_contact:
             # No unreplied campaign found for this contact
-            return
+            return None
 
         # Mark as replied
         campaign_contact.is_replied = True
         self.session.add(campaign_contact)
-        await self.session.commit()
+        await self.session.flush()
         
         logger.info(f"Marked campaign {campaign_contact.campaign_id} as replied for contact {contact_id}")
-        
-        # Notify progress update (stats will change)
-        stats = await self.campaigns.get_stats_by_id(campaign_contact.campaign_id)
+        return campaign_contact.campaign_id
+
+    async def notify_progress(self, campaign_id: UUID):
+        """Notify campaign progress (stats changed). Call after commit."""
+        stats = await self.campaigns.get_stats_by_id(campaign_id)
         if stats:
-             await self.notifier.notify_campaign_progress(
-                campaign_id=campaign_contact.campaign_id,
+            await self.notifier.notify_campaign_progress(
+                campaign_id=campaign_id,
                 **stats
             )
@@ -1,4 +1,4 @@
-import mimetypes
+import secrets
 import uuid
 
 from loguru import logger
@@ -8,7 +8,12 @@ from src.clients.meta import MetaClient
 from src.core.config import settings
 from src.repositories.message import MessageRepository
 from src.schemas import MetaMedia, MetaMessage
-from src.services.media.storage import StorageService
+from src.services.media.storage import (
+    AsyncIteratorFile,
+    STREAM_CHUNK_SIZE,
+    StorageService,
+    guess_extension,
+)
 
 
 class MediaService:
@@ -30,22 +35,26 @@ class MediaService:
                 return
 
             media_url_meta = await self.meta_client.get_media_url(media_obj.id)
-            file_content = await self.meta_client.download_media_file(media_url_meta)
 
             mime_type = media_obj.mime_type or "application/octet-stream"
-            ext = mimetypes.guess_extension(mime_type) or ".bin"
-            filename = f"{uuid.uuid4()}{ext}"
+            ext = guess_extension(mime_type) or ".bin"
+            filename = f"{secrets.token_urlsafe(16)}{ext}"
 
             r2_key = f"whatsapp/{meta_msg.type}s/{filename}"
 
-            await self.storage.upload_file(file_content, r2_key, mime_type)
+            async with self.meta_client.download_media_file(media_url_meta) as response:
+                file_stream = AsyncIteratorFile(
+                    response.aiter_bytes(STREAM_CHUNK_SIZE)
+                )
+                await self.storage.upload_stream(file_stream, r2_key, mime_type)
+                file_size = file_stream.size
 
             await self.messages.add_media_file(
                 message_id=message_id,
                 meta_media_id=media_obj.id,
                 file_name=filename,
                 file_mime_type=mime_type,
-                file_size=len(file_content),
+                file_size=file_size,
                 caption=media_obj.caption,
                 r2_key=r2_key,
                 bucket_name=settings.R2_BUCKET_NAME,
@@ -1,7 +1,43 @@
+import asyncio
+import mimetypes
+from contextlib import asynccontextmanager
+from functools import lru_cache
+
 import aioboto3
 
 from src.core.config import settings
 
+# Chunk size for streaming downloads into R2 (upload_fileobj splits into parts)
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+# Types the WhatsApp Cloud API delivers/accepts; mime params (e.g. "; codecs=opus") are stripped
+_EXT_BY_MIME = {
+    "image/jpeg": ".jpg",
+    "image/png": ".png",
+    "image/webp": ".webp",
+    "video/mp4": ".mp4",
+    "video/3gpp": ".3gp",
+    "audio/ogg": ".ogg",
+    "audio/mpeg": ".mp3",
+    "audio/mp4": ".m4a",
+    "audio/aac": ".aac",
+    "audio/amr": ".amr",
+    "application/pdf": ".pdf",
+    "text/plain": ".txt",
+}
+
+
+@lru_cache(maxsize=64)
+def _guess_extension_fallback(mime_type: str) -> str | None:
+    return mimetypes.guess_extension(mime_type)
+
+
+def guess_extension(mime_type: str) -> str | None:
+    """Extension for a media mime type; dict lookup first, mimetypes for the rest."""
+    base_type = mime_type.split(";", 1)[0].strip().lower()
+    return _EXT_BY_MIME.get(base_type) or _guess_extension_fallback(base_type)
+
 
 class AsyncIteratorFile:
     """
@@ -11,44 +47,70 @@ class AsyncIteratorFile:
 
     def __init__(self, iterator):
         self.iterator = iterator
-        self.buffer = b""
+        self.buffer = bytearray()
+        self.size = 0
+
+    async def _next_chunk(self) -> bytes | None:
+        try:
+            chunk = await self.iterator.__anext__()
+        except StopAsyncIteration:
+            return None
+        self.size += len(chunk)
+        return chunk
 
     async def read(self, n=-1):
         if n == -1:
-            data = [self.buffer]
-            async for chunk in self.iterator:
-                data.append(chunk)
-            self.buffer = b""
-            return b"".join(data)
+            while (chunk := await self._next_chunk()) is not None:
+                self.buffer.extend(chunk)
+            data = bytes(self.buffer)
+            self.buffer.clear()
+            return data
 
         while len(self.buffer) < n:
-            try:
-                chunk = await self.iterator.__anext__()
-                self.buffer += chunk
-            except StopAsyncIteration:
+            chunk = await self._next_chunk()
+            if chunk is None:
                 break
+            self.buffer.extend(chunk)
 
-        result = self.buffer[:n]
-        self.buffer = self.buffer[n:]
+        result = bytes(self.buffer[:n])
+        del self.buffer[:n]
         return result
 
 
+def create_s3_client():
+    """
+    Повертає async context manager S3-клієнта для R2.
+    Використовується при старті застосунку, щоб тримати одне з'єднання.
+    """
+    return aioboto3.Session().client(
+        service_name="s3",
+        endpoint_url=settings.R2_ENDPOINT_URL,
+        aws_access_key_id=settings.R2_ACCESS_KEY,
+        aws_secret_access_key=settings.R2_SECRET_KEY,
+        region_name="auto",
+    )
+
+
 class StorageService:
-    def __init__(self):
-        self.session = aioboto3.Session()
+    def __init__(self, s3_client=None):
+        self.s3 = s3_client
         self.bucket = settings.R2_BUCKET_NAME
 
+    @asynccontextmanager
+    async def _client(self):
+        """Довгоживучий клієнт, якщо він переданий, інакше тимчасовий."""
+        if self.s3 is not None:
+            yield self.s3
+            return
+
+        async with create_s3_client() as s3:
+            yield s3
+
     async def upload_file(
         self, file_content: bytes, object_name: str, content_type: str
     ) -> str:
         """Завантаження байтів (для малих файлів)"""
-        async with self.session.client(
-            service_name="s3",
-            endpoint_url=settings.R2_ENDPOINT_URL,
-            aws_access_key_id=settings.R2_ACCESS_KEY,
-            aws_secret_access_key=settings.R2_SECRET_KEY,
-            region_name="auto",
-        ) as s3:
+        async with self._client() as s3:
             await s3.put_object(
                 Bucket=self.bucket,
                 Key=object_name,
@@ -64,13 +126,7 @@ class StorageService:
         Потокове завантаження (для великих файлів).
         file_stream може бути AsyncIteratorFile або будь-який об'єкт з async read().
         """
-        async with self.session.client(
-            service_name="s3",
-            endpoint_url=settings.R2_ENDPOINT_URL,
-            aws_access_key_id=settings.R2_ACCESS_KEY,
-            aws_secret_access_key=settings.R2_SECRET_KEY,
-            region_name="auto",
-        ) as s3:
+        async with self._client() as s3:
             await s3.upload_fileobj(
                 Fileobj=file_stream,
                 Bucket=self.bucket,
@@ -87,16 +143,29 @@ class StorageService:
         return f"https://{self.bucket}.{settings.R2_ACCOUNT_ID}.r2.cloudflarestorage.com/{object_name}"
 
     async def get_presigned_url(self, object_name: str, expires_in: int = 3600) -> str:
-        async with self.session.client(
-            service_name="s3",
-            endpoint_url=settings.R2_ENDPOINT_URL,
-            aws_access_key_id=settings.R2_ACCESS_KEY,
-            aws_secret_access_key=settings.R2_SECRET_KEY,
-            region_name="auto",
-        ) as s3:
+        async with self._client() as s3:
             url = await s3.generate_presigned_url(
                 "get_object",
                 Params={"Bucket": self.bucket, "Key": object_name},
                 ExpiresIn=expires_in,
             )
             return url
+
+    async def get_presigned_urls(
+        self, object_names: list[str], expires_in: int = 3600
+    ) -> list[str]:
+        """Підписує кілька ключів одним клієнтом, паралельно (порядок збережено)"""
+        if not object_names:
+            return []
+
+        async with self._client() as s3:
+            return await asyncio.gather(
+                *(
+                    s3.generate_presigned_url(
+                        "get_object",
+                        Params={"Bucket": self.bucket, "Key": name},
+                        ExpiresIn=expires_in,
+                    )
+                    for name in object_names
+                )
+            )
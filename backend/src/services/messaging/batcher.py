@@ -0,0 +1,111 @@
+import asyncio
+
+from loguru import logger
+
+from src.schemas import MetaWebhookPayload
+from src.services.messaging.processor import MessageProcessorService
+
+
+class WebhookBatcher:
+    """
+    Coalesces webhooks delivered concurrently into one processing pass.
+
+    The first webhook of a batch becomes the leader: it waits until the batch
+    is full or `max_wait` elapses, then processes every entry with its own
+    processor. The other callers just wait for that pass to finish, so each
+    NATS message is acked only after its data is committed.
+    """
+
+    def __init__(self, max_size: int, max_wait: float):
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self._pending: list[tuple[MetaWebhookPayload, asyncio.Future]] = []
+        self._full = asyncio.Event()
+
+    async def submit(
+        self, webhook: MetaWebhookPayload, processor: MessageProcessorService
+    ):
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((webhook, future))
+
+        if len(self._pending) >= self.max_size:
+            self._full.set()
+
+        if len(self._pending) == 1:
+            await self._lead(processor, future)
+
+        await future
+
+    async def _lead(
+        self, processor: MessageProcessorService, own_future: asyncio.Future
+    ):
+        batch = None
+        try:
+            try:
+                await asyncio.wait_for(self._full.wait(), timeout=self.max_wait)
+            except asyncio.TimeoutError:
+                pass
+
+            batch, self._pending = self._pending, []
+            self._full.clear()
+            await self._flush(batch, processor)
+        finally:
+            if batch is None:
+                # Cancelled while waiting: the next submit starts a new batch
+                batch, self._pending = self._pending, []
+                self._full.clear()
+            # Never leave followers waiting on a leader that is gone
+            for _, future in batch:
+                if future.done():
+                    continue
+                if future is own_future:
+                    future.cancel()
+                else:
+                    future.set_exception(
+                        RuntimeError(
+                            "Webhook batch leader stopped; batch outcome unknown"
+                        )
+                    )
+
+    async def _flush(
+        self,
+        batch: list[tuple[MetaWebhookPayload, asyncio.Future]],
+        processor: MessageProcessorService,
+    ):
+        merged = MetaWebhookPayload(
+            object=batch[0][0].object,
+            entry=[entry for webhook, _ in batch for entry in webhook.entry],
+        )
+
+        try:
+            await processor.process_webhook(merged)
+        except Exception as e:
+            # Handlers are idempotent (wamid dedup, status weights), so
+            # replaying webhooks one by one after a partial commit is safe.
+            logger.warning(
+                f"Batched processing of {len(batch)} webhooks failed, "
+                f"retrying one by one: {e}"
+            )
+            await self._rollback(processor)
+            for webhook, future in batch:
+                try:
+                    await processor.process_webhook(webhook)
+                    if not future.done():
+                        future.set_result(None)
+                except Exception as single_error:
+                    await self._rollback(processor)
+                    if not future.done():
+                        future.set_exception(single_error)
+            return
+
+        logger.debug(f"Processed {len(batch)} webhooks in one batch")
+        for _, future in batch:
+            # A cancelled follower's future is already done
+            if not future.done():
+                future.set_result(None)
+
+    @staticmethod
+    async def _rollback(processor: MessageProcessorService):
+        await processor.session.rollback()
+        # Notifications staged for the rolled-back changes must not be sent
+        processor.system_handler.discard()
@@ -82,8 +82,13 @@ class ChatService:
         """Format messages with presigned media URLs."""
         response_data = []
 
+        # Presign every media file of the page at once instead of one by one
+        all_media = [mf for msg in messages for mf in msg.media_files]
+        urls = await self.storage.get_presigned_urls([mf.r2_key for mf in all_media])
+        url_by_media_id = {mf.id: url for mf, url in zip(all_media, urls)}
+
         for msg in messages:
-            media_dtos = await self._format_media_files(msg.media_files)
+            media_dtos = self._format_media_files(msg.media_files, url_by_media_id)
 
             msg_dto = MessageResponse(
                 id=msg.id,
@@ -106,12 +111,14 @@ class ChatService:
 
         return list(reversed(response_data))
 
-    async def _format_media_files(self, media_files) -> list[MediaFileResponse]:
-        """Generate presigned URLs for media files."""
+    def _format_media_files(
+        self, media_files, url_by_media_id: dict
+    ) -> list[MediaFileResponse]:
+        """Build media DTOs from pre-generated presigned URLs."""
         media_dtos = []
 
         for mf in media_files:
-            url = await self.storage.get_presigned_url(mf.r2_key)
+            url = url_by_media_id[mf.id]
 
             media_dtos.append(
                 MediaFileResponse(
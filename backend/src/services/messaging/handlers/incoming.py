@@ -1,22 +1,29 @@
+import asyncio
 import uuid
+from collections import defaultdict
 
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.broker import broker
-from src.models import MessageDirection, MessageStatus, get_utc_now
+from src.core.database import async_session_maker
+from src.models import Contact, MessageDirection, MessageStatus, get_utc_now
 from src.repositories.contact import ContactRepository
 from src.repositories.message import MessageRepository
-from src.repositories.waba import WabaPhoneRepository
 from src.schemas import MetaMessage
 from src.services.media.service import MediaService
 from src.services.messaging.parsers import extract_message_body, prepare_media_task
 from src.services.notifications.service import NotificationService
+from src.services.waba_cache import get_waba_phone
 
 
 from src.services.campaign.tracker import CampaignTrackerService
 
 
+# Max number of senders from one webhook batch processed concurrently
+INCOMING_CONCURRENCY = 8
+
+
 class IncomingMessageHandler:
     """Orchestrates incoming message processing workflow."""
 
@@ -33,40 +40,110 @@ class IncomingMessageHandler:
         # Services & Repositories
         self.contacts = ContactRepository(session)
         self.messages = MessageRepository(session)
-        self.waba_phones = WabaPhoneRepository(session)
         self.campaign_tracker = CampaignTrackerService(session, notifier)
 
     async def handle(self, messages: list[MetaMessage], phone_number_id: str):
         """Main entry point."""
-        waba_phone = await self.waba_phones.get_by_phone_id(phone_number_id)
+        waba_phone = await get_waba_phone(self.session, phone_number_id)
         if not waba_phone:
             logger.warning(f"Unknown phone ID: {phone_number_id}")
             return
 
+        # Deduplicate the whole batch with one query instead of one per message
+        existing_wamids = await self.messages.get_existing_wamids(
+            [m.id for m in messages if m.type != "reaction"]
+        )
+
+        # Messages from one sender touch the same contact row and must keep
+        # their order, so only distinct senders are processed in parallel.
+        by_sender: dict[str, list[MetaMessage]] = defaultdict(list)
         for msg in messages:
-            if msg.type == "reaction" and msg.reaction:
-                await self._handle_reaction(msg)
-            else:
-                await self._handle_message(msg, waba_phone.id)
-
-    async def _handle_message(self, msg: MetaMessage, waba_id: uuid.UUID):
-        """Processes a single standard message."""
-        # 1. Deduplication
-        if await self.messages.exists_by_wamid(msg.id):
-            logger.info(f"Message {msg.id} deduplicated")
+            if msg.type != "reaction" and msg.id in existing_wamids:
+                logger.info(f"Message {msg.id} deduplicated")
+                continue
+            existing_wamids.add(msg.id)
+            by_sender[msg.from_].append(msg)
+
+        if len(by_sender) == 1:
+            [batch] = by_sender.values()
+            await self._handle_batch(batch, waba_phone.id)
             return
 
-        # 2. Update Contact Activity
-        contact = await self.contacts.update_activity(msg.from_)
+        semaphore = asyncio.Semaphore(INCOMING_CONCURRENCY)
+
+        async def _handle_sender(batch: list[MetaMessage]):
+            # AsyncSession is not concurrency-safe: one session per task
+            async with semaphore, async_session_maker() as session:
+                handler = IncomingMessageHandler(
+                    session, self.media_service, self.notifier
+                )
+                await handler._handle_batch(batch, waba_phone.id)
+
+        await asyncio.gather(*(_handle_sender(b) for b in by_sender.values()))
+
+    async def _handle_batch(self, messages: list[MetaMessage], waba_id: uuid.UUID):
+        """
+        Processes one sender's messages in this handler's session.
+        All rows are written in a single commit; side effects run after it.
+        """
+        contact = None
+        replied_campaign_id = None
+        created: list[tuple] = []
+        reactions: list[tuple] = []
+        batch_ids: dict[str, uuid.UUID] = {}
 
-        # 3. Campaign Tracker
-        await self.campaign_tracker.handle_reply(contact.id)
+        for msg in messages:
+            if msg.type == "reaction" and msg.reaction:
+                target_msg = await self._handle_reaction(msg)
+                if target_msg:
+                    reactions.append((target_msg.id, msg.reaction.emoji, msg.from_))
+                continue
 
-        # 4. Create Message in DB
-        body = extract_message_body(msg)
-        reply_to_id = await self.messages.resolve_reply_id(msg, contact.id)
+            if contact is None:
+                contact = await self.contacts.get_or_create(msg.from_)
+                replied_campaign_id = await self.campaign_tracker.handle_reply(
+                    contact.id
+                )
+
+            result = await self._handle_message(msg, waba_id, contact, batch_ids)
+            if result:
+                created.append(result)
+
+        await self.session.commit()
+
+        # Side effects only after the data is durable
+        if replied_campaign_id:
+            await self.campaign_tracker.notify_progress(replied_campaign_id)
+
+        for target_id, emoji, phone in reactions:
+            await self.notifier.notify_message_reaction(
+                message_id=target_id, reaction=emoji, phone=phone
+            )
+
+        for new_msg, media_task in created:
+            await self._dispatch_side_effects(new_msg, contact, media_task)
 
-        new_msg = await self.messages.create(
+    async def _handle_message(
+        self,
+        msg: MetaMessage,
+        waba_id: uuid.UUID,
+        contact: Contact,
+        batch_ids: dict[str, uuid.UUID],
+    ):
+        """
+        Stages a single standard message. Does NOT commit.
+        Returns None if the wamid was stored concurrently by another delivery.
+        """
+        # 1. Create Message (parent may be earlier in this batch)
+        body = extract_message_body(msg)
+        if msg.context and msg.context.id in batch_ids:
+            reply_to_id = batch_ids[msg.context.id]
+        else:
+            reply_to_id = await self.messages.resolve_reply_id(msg, contact.id)
+
+        # The unique wamid index makes this race-free: a duplicate returns None
+        new_msg = await self.messages.create_if_absent(
+            id=uuid.uuid4(),
             waba_phone_id=waba_id,
             contact_id=contact.id,
             direction=MessageDirection.INBOUND,
@@ -76,25 +153,24 @@ class IncomingMessageHandler:
             body=body,
             reply_to_message_id=reply_to_id,
         )
+        if new_msg is None:
+            logger.info(f"Message {msg.id} deduplicated on insert")
+            return None
+        batch_ids[msg.id] = new_msg.id
 
-        # !!! ВАЖЛИВО: Генеруємо ID перед тим як використовувати його далі !!!
-        await self.session.flush()
+        # 2. Update Contact Activity (only for messages actually stored)
+        await self.contacts.update_activity(msg.from_, contact=contact)
 
         # Оновлюємо посилання на останнє повідомлення
-        contact.last_message_id = new_msg.id
+        contact.last_message = new_msg
         self.contacts.add(contact)
 
-        # 5. Prepare Side Effects (тепер new_msg.id точно існує)
+        # 3. Prepare Side Effects
         media_task = prepare_media_task(msg, new_msg.id)
-
-        # 6. Commit Transaction
-        await self.session.commit()
-
-        # 7. Dispatch Side Effects (After Commit)
-        await self._dispatch_side_effects(new_msg, contact, media_task)
+        return new_msg, media_task
 
     async def _handle_reaction(self, msg: MetaMessage):
-        """Processes reaction events."""
+        """Stages a reaction update. Does NOT commit."""
         target_msg = await self.messages.get_by_wamid(msg.reaction.message_id)
 
         if not target_msg:
@@ -107,20 +183,13 @@ class IncomingMessageHandler:
             logger.warning(
                 f"Target message {msg.reaction.message_id} for reaction not found."
             )
-            return
+            return None
 
         target_msg.reaction = msg.reaction.emoji
         self.messages.add(target_msg)
         logger.info(
             f"Updated reaction for msg {target_msg.id}: {msg.reaction.emoji}")
-
-        await self.session.commit()
-
-        await self.notifier.notify_message_reaction(
-            message_id=target_msg.id,
-            reaction=msg.reaction.emoji,
-            phone=msg.from_,
-        )
+        return target_msg
 
     async def _dispatch_side_effects(self, new_msg, contact, media_task: dict | None):
         """Handles NATS publishing and WebSocket notifications."""
@@ -6,6 +6,22 @@ from src.repositories.message import MessageRepository
 from src.schemas import MetaStatus
 from src.services.notifications.service import NotificationService
 
+_META_STATUS_MAP: dict[str, MessageStatus] = {
+    "sent": MessageStatus.SENT,
+    "delivered": MessageStatus.DELIVERED,
+    "read": MessageStatus.READ,
+    "failed": MessageStatus.FAILED,
+}
+
+# FAILED має найвищий пріоритет, його не можна перезаписати на READ/DELIVERED
+_STATUS_WEIGHT: dict[MessageStatus, int] = {
+    MessageStatus.PENDING: 0,
+    MessageStatus.SENT: 1,
+    MessageStatus.DELIVERED: 2,
+    MessageStatus.READ: 3,
+    MessageStatus.FAILED: 4,
+}
+
 
 class StatusHandler:
     """Handles message status updates from WhatsApp webhook."""
@@ -21,24 +37,18 @@ class StatusHandler:
 
     async def handle(self, statuses: list[MetaStatus]):
         """Process status updates for messages."""
-        status_map = {
-            "sent": MessageStatus.SENT,
-            "delivered": MessageStatus.DELIVERED,
-            "read": MessageStatus.READ,
-            "failed": MessageStatus.FAILED,
-        }
-
         notifications_to_send = []
 
+        # 1. Шукаємо всі повідомлення батчу одним запитом (разом з contact)
+        wamids = [s.id for s in statuses if s.status in _META_STATUS_MAP]
+        messages_by_wamid = await self.messages.get_by_wamids(wamids)
+
         for status in statuses:
-            new_status = status_map.get(status.status)
+            new_status = _META_STATUS_MAP.get(status.status)
             if not new_status:
                 continue
 
-            # 1. Шукаємо повідомлення
-            # Важливо: переконайся, що get_by_wamid підтягує contact (joinedload),
-            # інакше message.contact.phone_number викличе додатковий запит або помилку
-            db_message = await self.messages.get_by_wamid(status.id)
+            db_message = messages_by_wamid.get(status.id)
 
             if not db_message:
                 logger.debug(
@@ -47,7 +57,9 @@ class StatusHandler:
                 continue
 
             # 2. Оновлюємо, тільки якщо новий статус "старший"
-            if self._is_newer_status(db_message.status, new_status):
+            if _STATUS_WEIGHT.get(new_status, -1) > _STATUS_WEIGHT.get(
+                db_message.status, -1
+            ):
                 db_message.status = new_status
 
                 # --- ДОДАНО: Збереження помилок від Meta ---
@@ -84,15 +96,3 @@ class StatusHandler:
         # Send notifications after commit
         for note in notifications_to_send:
             await self.notifier.notify_message_status(**note)
-
-    def _is_newer_status(self, old: MessageStatus, new: MessageStatus) -> bool:
-        """Check if the new status is a progression from the old status."""
-        weights = {
-            MessageStatus.PENDING: 0,
-            MessageStatus.SENT: 1,
-            MessageStatus.DELIVERED: 2,
-            MessageStatus.READ: 3,
-            MessageStatus.FAILED: 4,
-        }
-        # FAILED має найвищий пріоритет, його не можна перезаписати на READ/DELIVERED
-        return weights.get(new, -1) > weights.get(old, -1)
@@ -1,3 +1,5 @@
+from typing import Awaitable, Callable
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models import get_utc_now
@@ -9,15 +11,24 @@ from src.schemas import (
     MetaTemplateUpdate,
 )
 from src.services.notifications.service import NotificationService
+from src.services.waba_cache import invalidate_waba_phones
 
 
 class SystemEventHandler:
-    """Handles system-level events like template updates, account reviews, and phone quality updates."""
+    """
+    Handles system-level events like template updates, account reviews, and phone quality updates.
+
+    Handlers only stage changes; commit() persists all events of a webhook
+    in one transaction and then sends their notifications.
+    """
 
     def __init__(self, session: AsyncSession, notifier: NotificationService):
         self.session = session
         self.notifier = notifier
 
+        self._pending_notifications: list[tuple[Callable[..., Awaitable], dict]] = []
+        self._phones_changed = False
+
         # Ініціалізуємо репозиторії
         self.templates = TemplateRepository(session)
         self.waba = WabaRepository(session)
@@ -32,14 +43,16 @@ class SystemEventHandler:
             template.updated_at = get_utc_now()
             self.templates.add(template)
 
-            await self.session.commit()
-
-        # Notify after commit
-        await self.notifier.notify_template_update(
-            template_id=update.message_template_id,
-            name=update.message_template_name,
-            status=update.event,
-            reason=update.reason,
+        self._pending_notifications.append(
+            (
+                self.notifier.notify_template_update,
+                {
+                    "template_id": update.message_template_id,
+                    "name": update.message_template_name,
+                    "status": update.event,
+                    "reason": update.reason,
+                },
+            )
         )
 
     async def handle_account_review(
@@ -51,11 +64,15 @@ class SystemEventHandler:
             account.account_review_status = update.decision
             self.waba.add(account)
 
-            await self.session.commit()
-
-        # Notify after commit
-        await self.notifier.notify_waba_update(
-            waba_id=waba_id, status=update.decision, event_type="REVIEW_UPDATE"
+        self._pending_notifications.append(
+            (
+                self.notifier.notify_waba_update,
+                {
+                    "waba_id": waba_id,
+                    "status": update.decision,
+                    "event_type": "REVIEW_UPDATE",
+                },
+            )
         )
 
     async def handle_phone_quality(self, update: MetaPhoneNumberQualityUpdate):
@@ -69,11 +86,35 @@ class SystemEventHandler:
                 phone.quality_rating = "GREEN"
 
             self.waba_phones.add(phone)
-            await self.session.commit()
+            self._phones_changed = True
 
-        # Notify after commit
-        await self.notifier.notify_phone_update(
-            phone_number=update.display_phone_number,
-            event=update.event,
-            current_limit=update.current_limit,
+        self._pending_notifications.append(
+            (
+                self.notifier.notify_phone_update,
+                {
+                    "phone_number": update.display_phone_number,
+                    "event": update.event,
+                    "current_limit": update.current_limit,
+                },
+            )
         )
+
+    def discard(self):
+        """Drop staged notifications after a rollback."""
+        self._pending_notifications = []
+        self._phones_changed = False
+
+    async def commit(self):
+        """Commit staged system events, then notify."""
+        if not self._pending_notifications:
+            return
+
+        await self.session.commit()
+        if self._phones_changed:
+            invalidate_waba_phones()
+
+        # Notify after commit
+        pending, self._pending_notifications = self._pending_notifications, []
+        self._phones_changed = False
+        for notify, kwargs in pending:
+            await notify(**kwargs)
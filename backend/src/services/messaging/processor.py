@@ -1,6 +1,8 @@
+from collections import defaultdict
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.schemas import MetaWebhookPayload
+from src.schemas import MetaMessage, MetaStatus, MetaWebhookPayload
 from src.services.media.service import MediaService
 from src.services.messaging.handlers import (
     IncomingMessageHandler,
@@ -32,7 +34,12 @@ class MessageProcessorService:
     async def process_webhook(self, webhook: MetaWebhookPayload):
         """
         Process incoming webhook by routing to appropriate handlers.
+        Messages and statuses are gathered across all entries/changes so
+        each handler runs once per webhook (or per coalesced batch).
         """
+        messages_by_phone: dict[str, list[MetaMessage]] = defaultdict(list)
+        statuses: list[MetaStatus] = []
+
         for entry in webhook.entry:
             waba_id = entry.id
 
@@ -55,12 +62,21 @@ class MessageProcessorService:
                         value.phone_number_quality_update
                     )
 
-                # Route incoming messages
+                # Collect incoming messages
                 if value.messages:
                     phone_id = value.metadata.get("phone_number_id")
                     if phone_id:
-                        await self.incoming_handler.handle(value.messages, phone_id)
+                        messages_by_phone[phone_id].extend(value.messages)
 
-                # Route status updates
+                # Collect status updates
                 if value.statuses:
-                    await self.status_handler.handle(value.statuses)
+                    statuses.extend(value.statuses)
+
+        # One commit for all system events of this webhook
+        await self.system_handler.commit()
+
+        for phone_id, messages in messages_by_phone.items():
+            await self.incoming_handler.handle(messages, phone_id)
+
+        if statuses:
+            await self.status_handler.handle(statuses)
@@ -1,4 +1,4 @@
-import mimetypes
+import secrets
 import uuid
 from datetime import datetime
 from src.models.base import get_utc_now
@@ -11,10 +11,10 @@ from src.core.config import settings
 from src.models import Contact, Message, MessageDirection, MessageStatus
 from src.repositories.contact import ContactRepository
 from src.repositories.message import MessageRepository
-from src.repositories.waba import WabaPhoneRepository
 from src.schemas import WhatsAppMessage
-from src.services.media.storage import StorageService
+from src.services.media.storage import StorageService, guess_extension
 from src.services.notifications.service import NotificationService
+from src.services.waba_cache import get_waba_phone_by_id
 
 
 class MessageSenderService:
@@ -39,7 +39,6 @@ class MessageSenderService:
         # Initialize repositories
         self.contacts = ContactRepository(session)
         self.messages = MessageRepository(session)
-        self.waba_phones = WabaPhoneRepository(session)
 
     async def send_manual_message(self, message: WhatsAppMessage):
         """Send a manual message (from API)."""
@@ -91,7 +90,7 @@ class MessageSenderService:
         # Get WABA phone
         waba_phone = None
         if phone_id:
-            waba_phone = await self.waba_phones.get_by_id(uuid.UUID(phone_id))
+            waba_phone = await get_waba_phone_by_id(self.session, uuid.UUID(phone_id))
         else:
             waba_phone = await self._get_preferred_phone(contact)
 
@@ -196,8 +195,8 @@ class MessageSenderService:
             body=caption,
         )
 
+        # id/created_at are client-side defaults, so a flush is enough here
         await self.session.flush()
-        await self.session.refresh(message)
 
         # Step 5: VALIDATION - Check MIME type
         # Якщо тип файлу не підтримується - ставимо статус FAILED, пишемо Warning і виходимо.
@@ -222,8 +221,8 @@ class MessageSenderService:
 
         try:
             # Step 6: Upload to R2 (permanent storage)
-            ext = mimetypes.guess_extension(mime_type) or ""
-            r2_filename = f"{uuid.uuid4()}{ext}"
+            ext = guess_extension(mime_type) or ""
+            r2_filename = f"{secrets.token_urlsafe(16)}{ext}"
             r2_key = f"whatsapp/{media_type}s/{r2_filename}"
 
             logger.info(f"Uploading to R2: {r2_key}")
@@ -283,7 +282,6 @@ class MessageSenderService:
             self.session.add(message)
 
             await self.session.commit()
-            await self.session.refresh(message)
 
             logger.info(
                 f"Media message sent to {phone_number}. WAMID: {wamid}")
@@ -383,7 +381,9 @@ class MessageSenderService:
             return
 
         if target_message.waba_phone_id:
-            waba_phone = await self.waba_phones.get_by_id(target_message.waba_phone_id)
+            waba_phone = await get_waba_phone_by_id(
+                self.session, target_message.waba_phone_id
+            )
         else:
             waba_phone = None
 
@@ -435,7 +435,7 @@ class MessageSenderService:
         """
         waba_phone = None
         if phone_id:
-            waba_phone = await self.waba_phones.get_by_id(uuid.UUID(phone_id))
+            waba_phone = await get_waba_phone_by_id(self.session, uuid.UUID(phone_id))
         else:
             waba_phone = await self._get_preferred_phone(contact)
 
@@ -493,7 +493,11 @@ class MessageSenderService:
             # Update body with rendered text
             message.body = message_body
         else:
+            # id/created_at are set up front instead of at flush: the row is
+            # INSERTed once, with its final status/wamid, when the caller commits.
             message = await self.messages.create(
+                id=uuid.uuid4(),
+                created_at=get_utc_now(),
                 waba_phone_id=waba_phone.id,
                 contact_id=contact.id,
                 direction=MessageDirection.OUTBOUND,
@@ -504,12 +508,10 @@ class MessageSenderService:
                 reply_to_message_id=reply_to_message_id,
             )
 
-        await self.session.flush()
-        await self.session.refresh(message)
-
         contact.updated_at = message.created_at
         contact.last_message_at = message.created_at
-        contact.last_message_id = message.id
+        # post_update: contacts.last_message_id is written after the INSERT
+        contact.last_message = message
 
         self.session.add(contact)
 
@@ -679,7 +681,7 @@ class MessageSenderService:
         if phone_id:
             try:
                 p_uuid = uuid.UUID(str(phone_id))
-                phone = await self.waba_phones.get_by_id(p_uuid)
+                phone = await get_waba_phone_by_id(self.session, p_uuid)
                 if phone:
                     return phone
             except ValueError:
@@ -688,7 +690,9 @@ class MessageSenderService:
         if contact.last_message_id:
             last_msg = await self.messages.get_by_id(contact.last_message_id)
             if last_msg and last_msg.waba_phone_id:
-                phone = await self.waba_phones.get_by_id(last_msg.waba_phone_id)
+                phone = await get_waba_phone_by_id(
+                    self.session, last_msg.waba_phone_id
+                )
                 if phone:
                     return phone
 
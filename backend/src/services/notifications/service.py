@@ -1,5 +1,7 @@
+import asyncio
 from uuid import UUID
 
+import orjson
 from loguru import logger
 
 from src.core.broker import broker
@@ -14,16 +16,72 @@ from src.schemas.events import (
 )
 
 
+NOTIFY_QUEUE_SIZE = 1000
+
+_notify_queue: asyncio.Queue | None = None
+_notify_task: asyncio.Task | None = None
+
+
+async def _send(event_data: dict):
+    try:
+        # Encoded once here; the WS listener forwards these bytes as-is
+        await broker.publish(
+            orjson.dumps(event_data, default=str),
+            subject="ws_updates",
+        )
+    except Exception as e:
+        logger.error(f"Failed to publish WS update: {e}")
+
+
+async def _notify_worker(queue: asyncio.Queue):
+    while True:
+        event_data = await queue.get()
+        try:
+            await _send(event_data)
+        finally:
+            queue.task_done()
+
+
+def start_notification_dispatcher():
+    """Start the background task that drains queued WS updates."""
+    global _notify_queue, _notify_task
+    if _notify_task:
+        return
+    _notify_queue = asyncio.Queue(maxsize=NOTIFY_QUEUE_SIZE)
+    _notify_task = asyncio.create_task(_notify_worker(_notify_queue))
+
+
+async def stop_notification_dispatcher(timeout: float = 5.0):
+    """Flush pending WS updates (best effort) and stop the dispatcher."""
+    global _notify_queue, _notify_task
+    if not _notify_task:
+        return
+    try:
+        await asyncio.wait_for(_notify_queue.join(), timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning(
+            f"Dropping {_notify_queue.qsize()} pending WS updates on shutdown")
+    _notify_task.cancel()
+    await asyncio.gather(_notify_task, return_exceptions=True)
+    _notify_queue, _notify_task = None, None
+
+
 class NotificationService:
     async def _publish(self, event_data: dict):
-        """Low-level publish to NATS"""
+        """
+        Queue a WS update so callers never wait on NATS.
+        Falls back to a direct publish when no dispatcher is running.
+        """
+        if _notify_queue is None:
+            await _send(event_data)
+            return
+
         try:
-            await broker.publish(
-                event_data,
-                subject="ws_updates",
+            _notify_queue.put_nowait(event_data)
+        except asyncio.QueueFull:
+            logger.warning(
+                f"WS update queue full, dropping {event_data.get('event')} event"
             )
-        except Exception as e:
-            logger.error(f"Failed to publish WS update: {e}")
 
     async def notify_new_message(
         self, message: Message, media_files: list[dict] = None, phone: str = None
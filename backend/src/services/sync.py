@@ -2,9 +2,10 @@ from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.clients.meta import MetaClient
-from src.models import Template, WabaAccount, WabaPhoneNumber, get_utc_now
+from src.models import Template, WabaAccount, get_utc_now
 from src.repositories.template import TemplateRepository
 from src.repositories.waba import WabaPhoneRepository, WabaRepository
+from src.services.waba_cache import invalidate_waba_phones
 
 
 class SyncService:
@@ -29,6 +30,7 @@ class SyncService:
             await self._sync_templates(waba_account)
 
             await self.session.commit()
+            invalidate_waba_phones()
             logger.success(
                 f"Synced account '{waba_account.name}' successfully")
 
@@ -52,15 +54,22 @@ class SyncService:
     async def _sync_phone_numbers(self, waba_account: WabaAccount):
         phones_data = await self.meta_client.fetch_phone_numbers(waba_account.waba_id)
 
-        # Collect phone IDs from Meta API
-        meta_phone_ids = set()
-        for item in phones_data.get("data", []):
-            phone_id = item.get("id")
-            if phone_id:
-                meta_phone_ids.add(phone_id)
-                await self._upsert_phone_number(waba_account.id, item)
+        rows = [
+            {
+                "waba_id": waba_account.id,
+                "phone_number_id": item["id"],
+                "display_phone_number": str(item.get("display_phone_number", "")),
+                "status": item.get("code_verification_status"),
+                "quality_rating": str(item.get("quality_rating", "UNKNOWN")),
+                "messaging_limit_tier": item.get("messaging_limit_tier"),
+                "is_deleted": False,
+            }
+            for item in phones_data.get("data", [])
+            if item.get("id")
+        ]
+        meta_phone_ids = {row["phone_number_id"] for row in rows}
 
-        # Get all existing phones (including deleted)
+        # Get all existing phones (including deleted) before the upsert
         existing_phones = await self.waba_phones.get_all_by_waba_id(waba_account.id)
 
         # Soft delete phones that no longer exist in Meta
@@ -70,13 +79,15 @@ class SyncService:
             if phone.phone_number_id not in meta_phone_ids and not phone.is_deleted
         ]
 
-        # Restore phones that were deleted but now exist in Meta
+        # Deleted phones that reappeared in Meta are restored by the upsert
         phones_to_restore = [
             phone.phone_number_id
             for phone in existing_phones
             if phone.phone_number_id in meta_phone_ids and phone.is_deleted
         ]
 
+        await self.waba_phones.upsert_many(rows)
+
         if phones_to_delete:
             deleted_count = await self.waba_phones.soft_delete_by_phone_ids(
                 phones_to_delete
@@ -86,39 +97,9 @@ class SyncService:
             )
 
         if phones_to_restore:
-            restored_count = await self.waba_phones.restore_by_phone_ids(
-                phones_to_restore
-            )
             logger.info(
-                f"Restored {restored_count} phone numbers that reappeared in Meta: {phones_to_restore}"
-            )
-
-    async def _upsert_phone_number(self, waba_db_id, item: dict):
-        phone_id = item.get("id")
-        if not phone_id:
-            return
-
-        phone_obj = await self.waba_phones.get_by_phone_id(phone_id, include_deleted=True)
-
-        if not phone_obj:
-            phone_obj = WabaPhoneNumber(
-                waba_id=waba_db_id,
-                phone_number_id=phone_id,
-                display_phone_number=str(item.get("display_phone_number", "")),
-                status=item.get("code_verification_status"),
-                quality_rating=str(item.get("quality_rating", "UNKNOWN")),
-                messaging_limit_tier=item.get("messaging_limit_tier"),
-                is_deleted=False,
+                f"Restored {len(phones_to_restore)} phone numbers that reappeared in Meta: {phones_to_restore}"
             )
-        else:
-            phone_obj.status = item.get("code_verification_status")
-            phone_obj.quality_rating = str(
-                item.get("quality_rating", "UNKNOWN"))
-            phone_obj.messaging_limit_tier = item.get("messaging_limit_tier")
-            phone_obj.is_deleted = False  # Restore if was soft-deleted
-            phone_obj.updated_at = get_utc_now()
-
-        self.session.add(phone_obj)
 
     async def _sync_templates(self, waba_account: WabaAccount):
         logger.info(f"Syncing templates for WABA: {waba_account.name}")
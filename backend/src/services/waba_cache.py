@@ -0,0 +1,67 @@
+from typing import NamedTuple
+from uuid import UUID
+
+from cachetools import TTLCache
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models import WabaPhoneNumber
+from src.repositories.waba import WabaPhoneRepository
+
+
+class CachedWabaPhone(NamedTuple):
+    """
+    Immutable snapshot of a phone row. Detached from any session, so it is
+    safe to share between concurrent handlers. Load the ORM row with
+    session.get(WabaPhoneNumber, id) when it needs to be modified.
+    """
+
+    id: UUID
+    waba_id: UUID
+    phone_number_id: str
+
+
+# Phone configuration changes on human timescales, so a short TTL is plenty.
+_phones_cache: TTLCache = TTLCache(maxsize=100, ttl=300)
+
+
+def _snapshot(phone: WabaPhoneNumber) -> CachedWabaPhone:
+    return CachedWabaPhone(
+        id=phone.id, waba_id=phone.waba_id, phone_number_id=phone.phone_number_id
+    )
+
+
+async def get_waba_phone(
+    session: AsyncSession, phone_number_id: str
+) -> CachedWabaPhone | None:
+    """Get an active phone by Meta phone_number_id, cached per process."""
+    cache_key = ("phone_number_id", phone_number_id)
+    if cache_key in _phones_cache:
+        return _phones_cache[cache_key]
+
+    phone = await WabaPhoneRepository(session).get_by_phone_id(phone_number_id)
+    if not phone:
+        return None
+
+    snapshot = _phones_cache[cache_key] = _snapshot(phone)
+    return snapshot
+
+
+async def get_waba_phone_by_id(
+    session: AsyncSession, phone_id: UUID
+) -> CachedWabaPhone | None:
+    """Get a phone by primary key, cached per process."""
+    cache_key = ("id", phone_id)
+    if cache_key in _phones_cache:
+        return _phones_cache[cache_key]
+
+    phone = await WabaPhoneRepository(session).get_by_id(phone_id)
+    if not phone:
+        return None
+
+    snapshot = _phones_cache[cache_key] = _snapshot(phone)
+    return snapshot
+
+
+def invalidate_waba_phones() -> None:
+    """Drop cached phones. Call after any write to waba_phone_numbers."""
+    _phones_cache.clear()
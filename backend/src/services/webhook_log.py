@@ -0,0 +1,107 @@
+import asyncio
+import uuid
+
+import orjson
+from loguru import logger
+
+from src.core.database import async_session_maker, engine
+from src.models import WebhookLog, get_utc_now
+
+WEBHOOK_LOG_BATCH_SIZE = 500
+WEBHOOK_LOG_FLUSH_INTERVAL = 0.1  # seconds
+WEBHOOK_LOG_QUEUE_SIZE = 10_000
+
+_COPY_COLUMNS = ["id", "payload", "processed_at"]
+
+_log_queue: asyncio.Queue | None = None
+_flush_task: asyncio.Task | None = None
+
+
+async def _insert_rows(payloads: list[str]):
+    """Per-row ORM insert, used when COPY is unavailable or fails."""
+    async with async_session_maker() as session:
+        session.add_all([WebhookLog(payload=orjson.loads(p)) for p in payloads])
+        await session.commit()
+
+
+async def _write_batch(payloads: list[str]):
+    now = get_utc_now()
+    records = [(uuid.uuid4(), p, now) for p in payloads]
+    try:
+        async with engine.connect() as conn:
+            raw = await conn.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                WebhookLog.__tablename__, records=records, columns=_COPY_COLUMNS
+            )
+        return
+    except Exception as e:
+        logger.warning(
+            f"COPY of {len(payloads)} webhook logs failed, falling back to INSERT: {e}"
+        )
+
+    try:
+        await _insert_rows(payloads)
+    except Exception as e:
+        logger.error(f"Failed to store {len(payloads)} webhook logs: {e}")
+
+
+async def _flush_loop(queue: asyncio.Queue):
+    loop = asyncio.get_running_loop()
+    stopping = False
+
+    while not stopping:
+        first = await queue.get()
+        if first is None:
+            break
+
+        batch = [first]
+        deadline = loop.time() + WEBHOOK_LOG_FLUSH_INTERVAL
+        while len(batch) < WEBHOOK_LOG_BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if item is None:
+                stopping = True
+                break
+            batch.append(item)
+
+        await _write_batch(batch)
+
+
+def start_webhook_log_writer():
+    """Start the background task that batches webhook logs into COPY writes."""
+    global _log_queue, _flush_task
+    if _flush_task:
+        return
+    _log_queue = asyncio.Queue(maxsize=WEBHOOK_LOG_QUEUE_SIZE)
+    _flush_task = asyncio.create_task(_flush_loop(_log_queue))
+
+
+async def stop_webhook_log_writer():
+    """Flush buffered webhook logs and stop the writer."""
+    global _log_queue, _flush_task
+    if not _flush_task:
+        return
+    # Sentinel: the loop writes what it has collected and exits
+    await _log_queue.put(None)
+    await asyncio.gather(_flush_task, return_exceptions=True)
+    _log_queue, _flush_task = None, None
+
+
+async def log_webhook(payload: str):
+    """
+    Buffer a raw webhook JSON body for storage in webhook_logs.
+    Writes directly when the writer is not running or the buffer is full.
+    """
+    if _log_queue is not None:
+        try:
+            _log_queue.put_nowait(payload)
+            return
+        except asyncio.QueueFull:
+            logger.warning("Webhook log buffer full, writing directly")
+
+    await _insert_rows([payload])
@@ -1,3 +1,4 @@
+import asyncio
 from typing import AsyncGenerator
 
 import httpx
@@ -7,8 +8,9 @@ from faststream import Context, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.clients.meta import MetaClient
+from src.core.config import settings
 from src.core.database import async_session_maker
-from src.core.logger import setup_logging
+from src.core.logger import logger
 from src.repositories.waba import WabaRepository
 from src.services.campaign.sender import CampaignSenderService
 from src.services.media.service import MediaService
@@ -18,10 +20,10 @@ from src.services.messaging.sender import MessageSenderService
 from src.services.notifications.service import NotificationService
 from src.services.sync import SyncService
 
-logger = setup_logging()
 
-limiter = AsyncLimiter(10, 1)
+limiter = AsyncLimiter(settings.META_RATE_PER_SEC, 1)
 credentials_cache: TTLCache = TTLCache(maxsize=100, ttl=300)
+_meta_client: MetaClient | None = None
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -51,11 +53,32 @@ async def _get_meta_credentials() -> tuple[str | None, str | None]:
 
 async def get_worker_meta_client(
     http_client: httpx.AsyncClient = Context("http_client"),
+    meta_semaphore: asyncio.Semaphore = Context("meta_semaphore"),
 ) -> MetaClient:
+    global _meta_client
     token, base_url = await _get_meta_credentials()
     if not token:
         raise ValueError("Meta credentials not found")
-    return MetaClient(client=http_client, base_url=base_url, token=token)
+
+    # MetaClient is stateless besides these; rebuild only when they change
+    client = _meta_client
+    if (
+        client is None
+        or client.client is not http_client
+        or client.token != token
+        or client.base_url != base_url
+    ):
+        client = _meta_client = MetaClient(
+            client=http_client,
+            base_url=base_url,
+            token=token,
+            semaphore=meta_semaphore,
+        )
+    return client
+
+
+def get_storage_service(s3_client=Context("s3_client")) -> StorageService:
+    return StorageService(s3_client=s3_client)
 
 
 # --- Service Assemblers ---
@@ -64,10 +87,9 @@ async def get_worker_meta_client(
 async def get_message_sender_service(
     session: AsyncSession = Depends(get_session),
     meta_client: MetaClient = Depends(get_worker_meta_client),
+    storage: StorageService = Depends(get_storage_service),
 ) -> MessageSenderService:
-    return MessageSenderService(
-        session, meta_client, NotificationService(), StorageService()
-    )
+    return MessageSenderService(session, meta_client, NotificationService(), storage)
 
 
 async def get_campaign_sender_service(
@@ -80,8 +102,9 @@ async def get_campaign_sender_service(
 async def get_processor_service(
     session: AsyncSession = Depends(get_session),
     meta_client: MetaClient = Depends(get_worker_meta_client),
+    storage: StorageService = Depends(get_storage_service),
 ) -> MessageProcessorService:
-    media_service = MediaService(session, StorageService(), meta_client)
+    media_service = MediaService(session, storage, meta_client)
     return MessageProcessorService(session, media_service, NotificationService())
 
 
@@ -1,11 +1,18 @@
 import asyncio
 
-import httpx
 import sentry_sdk
 from faststream import ContextRepo, FastStream
 
+from src.clients.meta import create_http_client
 from src.core.broker import broker, setup_jetstream
 from src.core.config import settings
+from src.core.logger import setup_logging
+from src.services.media.storage import create_s3_client
+from src.services.notifications.service import (
+    start_notification_dispatcher,
+    stop_notification_dispatcher,
+)
+from src.services.webhook_log import start_webhook_log_writer, stop_webhook_log_writer
 from src.worker.dependencies import logger
 from src.worker.routers.campaigns import router as campaigns_router
 from src.worker.routers.media import router as media_router
@@ -13,6 +20,8 @@ from src.worker.routers.messages import router as messages_router
 from src.worker.routers.system import router as system_router
 from src.worker.tasks import scheduled_campaigns_checker, scheduled_messages_checker
 
+setup_logging()
+
 app = FastStream(broker)
 
 broker.include_router(campaigns_router)
@@ -35,13 +44,18 @@ async def startup_handler(context: ContextRepo):
     global campaign_scheduler_task, message_scheduler_task
     logger.info("FastStream Worker: Starting up...")
 
-    http_client = httpx.AsyncClient(
-        timeout=30.0,
-        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+    context.set_global("http_client", create_http_client())
+    context.set_global(
+        "meta_semaphore", asyncio.Semaphore(settings.META_CONCURRENCY)
     )
-    context.set_global("http_client", http_client)
+
+    s3_context = create_s3_client()
+    context.set_global("s3_context", s3_context)
+    context.set_global("s3_client", await s3_context.__aenter__())
 
     await setup_jetstream()
+    start_notification_dispatcher()
+    start_webhook_log_writer()
 
     campaign_scheduler_task = asyncio.create_task(
         scheduled_campaigns_checker(broker))
@@ -70,8 +84,15 @@ async def shutdown_handler(context: ContextRepo):
         except asyncio.CancelledError:
             pass
 
+    await stop_webhook_log_writer()
+    await stop_notification_dispatcher()
+
     http_client = context.get("http_client")
     if http_client:
         await http_client.aclose()
+
+    s3_context = context.get("s3_context")
+    if s3_context:
+        await s3_context.__aexit__(None, None, None)
     logger.info("Shutdown complete.")
 
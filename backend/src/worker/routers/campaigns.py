@@ -1,7 +1,7 @@
 import asyncio
-import json
 from uuid import UUID
 
+import orjson
 from faststream import Depends
 from faststream.nats import NatsRouter
 
@@ -10,6 +10,8 @@ from src.core.database import async_session_maker
 from src.repositories.campaign import CampaignContactRepository, CampaignRepository
 from src.models import CampaignStatus
 from src.services.campaign.sender import CampaignSenderService
+from src.services.messaging.sender import MessageSenderService
+from src.services.notifications.service import NotificationService
 from src.worker.dependencies import (
     get_campaign_sender_service,
     limiter,
@@ -22,6 +24,105 @@ router = NatsRouter()
 campaign_consumers: dict[str, asyncio.Task] = {}
 
 
+def _build_campaign_sender(
+    session, service: CampaignSenderService
+) -> CampaignSenderService:
+    """Same wiring as the injected service, bound to another session."""
+    message_sender = service.executor.sender
+    return CampaignSenderService(
+        session,
+        MessageSenderService(
+            session,
+            message_sender.meta_client,
+            NotificationService(),
+            message_sender.storage,
+        ),
+        NotificationService(),
+    )
+
+
+async def _get_campaign_status(campaign_id: str) -> CampaignStatus | None:
+    # Short-lived session: no connection is held while sends wait on the limiter
+    async with async_session_maker() as session:
+        campaign = await CampaignRepository(session).get_by_id(UUID(campaign_id))
+        return campaign.status if campaign else None
+
+
+async def _process_campaign_message(
+    msg, campaign_id: str, service: CampaignSenderService
+) -> bool:
+    """
+    Handle one pulled campaign message of a RUNNING campaign.
+    Returns True only when the message was sent successfully.
+    """
+    try:
+        payload = orjson.loads(msg.data)
+    except Exception:
+        await msg.ack()
+        return False
+
+    # Basic payload validation
+    cid = payload.get("campaign_id") or campaign_id
+    link_id = payload.get("link_id")
+    contact_id = payload.get("contact_id")
+    if not (cid and link_id and contact_id):
+        await msg.ack()
+        return False
+
+    # Limiter first, so the session (and its connection) is only taken
+    # for the duration of the send itself
+    async with limiter:
+        try:
+            async with async_session_maker() as session:
+                success = await _build_campaign_sender(
+                    session, service
+                ).send_single_message(
+                    campaign_id=UUID(cid),
+                    link_id=UUID(link_id),
+                    contact_id=UUID(contact_id),
+                    check_completion=False,
+                )
+            await msg.ack()
+        except Exception as e:
+            logger.exception(f"Failed to send: {e}")
+            await msg.ack()
+            return False
+
+    if not success:
+        logger.debug(f"Send failed/skipped for contact {contact_id}")
+    return success
+
+
+async def _notify_campaign_stats(campaign_id: str, service: CampaignSenderService):
+    try:
+        async with async_session_maker() as stats_session:
+            stats_repo = CampaignRepository(stats_session)
+            stats = await stats_repo.get_stats_by_id(UUID(campaign_id))
+            if stats:
+                total = stats.get("total_contacts", 0)
+                sent = stats.get("sent_count", 0)
+                delivered = stats.get("delivered_count", 0)
+                failed = stats.get("failed_count", 0)
+                read = stats.get("read_count", 0)
+
+                percent = 0
+                if total > 0:
+                    processed_items = sent + failed
+                    percent = int((processed_items / total) * 100)
+
+                await service.lifecycle.notifier.notify_campaign_progress(
+                    campaign_id=UUID(campaign_id),
+                    total=total,
+                    sent=sent,
+                    delivered=delivered,
+                    read=read,
+                    failed=failed,
+                    progress_percent=percent
+                )
+    except Exception as e:
+        logger.error(f"Failed to send progress update: {e}")
+
+
 async def consume_campaign_messages(
     campaign_id: str,
     service: CampaignSenderService,
@@ -73,102 +174,62 @@ async def consume_campaign_messages(
                 await asyncio.sleep(0.5)
                 continue
 
-            for msg in messages:
-                try:
-                    payload = json.loads(msg.data.decode())
-                except Exception:
-                    await msg.ack()
-                    continue
+            # Check campaign is still RUNNING before processing the batch
+            try:
+                status = await _get_campaign_status(campaign_id)
+            except Exception as e:
+                logger.error(f"Failed to check campaign {campaign_id} status: {e}")
+                await asyncio.sleep(0.5)
+                continue
 
-                # Basic payload validation
-                cid = payload.get("campaign_id") or campaign_id
-                link_id = payload.get("link_id")
-                contact_id = payload.get("contact_id")
-                if not (cid and link_id and contact_id):
+            if status != CampaignStatus.RUNNING:
+                # Remaining contacts are republished on resume
+                for msg in messages:
                     await msg.ack()
+
+                if status is None:
+                    logger.debug(f"Campaign {campaign_id} not found")
                     continue
 
-                # Check campaign is still RUNNING before processing
+                # Stop consumer for PAUSED and finished campaigns
+                if status in [
+                    CampaignStatus.PAUSED,
+                    CampaignStatus.COMPLETED,
+                    CampaignStatus.FAILED,
+                ]:
+                    logger.info(
+                        f"Stopping consumer; campaign status={status}")
+                    raise asyncio.CancelledError()
+
+                logger.debug(f"Skipping batch; campaign status={status}")
+                continue
+
+            # Sends of one fetched batch run concurrently, each on its own
+            # session; the limiter still caps the Meta rate.
+            results = await asyncio.gather(
+                *(
+                    _process_campaign_message(msg, campaign_id, service)
+                    for msg in messages
+                ),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Campaign message handling failed: {result}")
+
+            # One completion check per batch instead of one per send
+            try:
                 async with async_session_maker() as session:
-                    try:
-                        campaigns_repo = CampaignRepository(session)
-                        campaign = await campaigns_repo.get_by_id(UUID(cid))
-                        if not campaign:
-                            logger.debug(f"Campaign {cid} not found")
-                            await msg.ack()
-                            continue
-                        
-                        # Only stop consumer for PAUSED campaigns
-                        # For COMPLETED, we continue to ack remaining messages
-                        if campaign.status == CampaignStatus.PAUSED:
-                            logger.debug(f"Halting consumer; campaign is paused")
-                            await msg.ack()
-                            raise asyncio.CancelledError()
-                        
-                        # For non-RUNNING (e.g., COMPLETED), just ack and skip
-                        if campaign.status != CampaignStatus.RUNNING:
-                            logger.debug(
-                                f"Skipping message; campaign status={campaign.status}")
-                            await msg.ack()
-                            
-                            if campaign.status in [CampaignStatus.COMPLETED, CampaignStatus.FAILED]:
-                                logger.info(f"Campaign {cid} is finished ({campaign.status}), stopping consumer")
-                                raise asyncio.CancelledError()
-                                
-                            continue
-                    finally:
-                        # Ensure session is explicitly closed
-                        await session.close()
-
-                # Process send
-                async with limiter:
-                    try:
-                        success = await service.send_single_message(
-                            campaign_id=UUID(cid),
-                            link_id=UUID(link_id),
-                            contact_id=UUID(contact_id),
-                        )
-                        await msg.ack()
-
-                        processed_count_for_stats += 1
-                        if processed_count_for_stats >= 5:
-                            processed_count_for_stats = 0
-                            try:
-                                async with async_session_maker() as stats_session:
-                                    stats_repo = CampaignRepository(stats_session)
-                                    stats = await stats_repo.get_stats_by_id(UUID(cid))
-                                    if stats:
-                                        total = stats.get("total_contacts", 0)
-                                        sent = stats.get("sent_count", 0)
-                                        delivered = stats.get("delivered_count", 0)
-                                        failed = stats.get("failed_count", 0)
-                                        read = stats.get("read_count", 0)
-                                        
-                                        percent = 0
-                                        if total > 0:
-                                            processed_items = sent + failed
-                                            percent = int((processed_items / total) * 100)
-                                        
-                                        await service.lifecycle.notifier.notify_campaign_progress(
-                                            campaign_id=UUID(cid),
-                                            total=total,
-                                            sent=sent,
-                                            delivered=delivered,
-                                            read=read,
-                                            failed=failed,
-                                            progress_percent=percent
-                                        )
-                            except Exception as e:
-                                logger.error(f"Failed to send progress update: {e}")
-
-                        if not success:
-                            logger.debug(
-                                f"Send failed/skipped for contact {contact_id}"
-                            )
-                    except Exception as e:
-                        logger.exception(f"Failed to send: {e}")
-                        await msg.ack()
-                        # continue processing
+                    await _build_campaign_sender(
+                        session, service
+                    ).lifecycle.check_and_complete_if_done(UUID(campaign_id))
+            except Exception as e:
+                logger.warning(f"Completion check failed for {campaign_id}: {e}")
+
+            processed_count_for_stats += sum(result is True for result in results)
+            if processed_count_for_stats >= 5:
+                processed_count_for_stats = 0
+                await _notify_campaign_stats(campaign_id, service)
 
     except asyncio.CancelledError:
         logger.info(f"Stopped pull consumer for {subject}")
@@ -190,6 +251,69 @@ async def consume_campaign_messages(
 # Push-based send subscriber removed; using per-campaign pull consumers instead
 
 
+async def _fetch_sendable_contacts(campaign_id: str, limit: int, offset: int):
+    async with async_session_maker() as session:
+        repo = CampaignContactRepository(session)
+        return await repo.get_sendable_contacts(
+            UUID(campaign_id), limit=limit, offset=offset
+        )
+
+
+async def _publish_sendable_contacts(campaign_id: str, action: str) -> int:
+    """
+    Publish one campaigns.send message per sendable contact, page by page.
+    The next page is fetched while the current one is being published.
+    Returns the number of published tasks.
+    """
+    batch_size = 100
+    offset = 0
+    next_page = asyncio.create_task(
+        _fetch_sendable_contacts(campaign_id, batch_size, offset)
+    )
+    try:
+        while next_page:
+            # Stop publishing if campaign is no longer RUNNING
+            async with async_session_maker() as check_session:
+                campaigns_repo = CampaignRepository(check_session)
+                campaign = await campaigns_repo.get_by_id(UUID(campaign_id))
+
+            if not campaign or campaign.status != CampaignStatus.RUNNING:
+                logger.info(
+                    f"Halting {action} publish; campaign status={campaign.status if campaign else 'unknown'}"
+                )
+                break
+
+            contacts = await next_page
+            next_page = None
+            if not contacts:
+                break
+
+            # A short page is the last one; skip the empty follow-up query
+            if len(contacts) == batch_size:
+                next_page = asyncio.create_task(
+                    _fetch_sendable_contacts(
+                        campaign_id, batch_size, offset + batch_size)
+                )
+
+            for link in contacts:
+                await broker.publish(
+                    {
+                        "campaign_id": campaign_id,
+                        "link_id": str(link.id),
+                        "contact_id": str(link.contact_id),
+                    },
+                    subject=f"campaigns.send.{campaign_id}",
+                    stream="campaigns",
+                )
+            offset += len(contacts)
+    finally:
+        if next_page:
+            next_page.cancel()
+            await asyncio.gather(next_page, return_exceptions=True)
+
+    return offset
+
+
 @router.subscriber("campaigns.start", stream="campaigns", durable="campaign-starter")
 async def handle_campaign_start(
     campaign_id: str,
@@ -203,47 +327,7 @@ async def handle_campaign_start(
             # Give DB time to propagate status change to other sessions
             await asyncio.sleep(0.5)
 
-            batch_size = 100
-            offset = 0
-            while True:
-                # Stop publishing if campaign is no longer RUNNING
-                async with async_session_maker() as check_session:
-                    try:
-                        campaigns_repo = CampaignRepository(check_session)
-                        campaign = await campaigns_repo.get_by_id(UUID(campaign_id))
-                        should_stop = not campaign or campaign.status != CampaignStatus.RUNNING
-                    finally:
-                        await check_session.close()
-
-                    if should_stop:
-                        logger.info(
-                            f"Halting start publish; campaign status={campaign.status if campaign else 'unknown'}"
-                        )
-                        break
-
-                async with async_session_maker() as session:
-                    try:
-                        repo = CampaignContactRepository(session)
-                        contacts = await repo.get_sendable_contacts(
-                            UUID(campaign_id), limit=batch_size, offset=offset
-                        )
-                    finally:
-                        await session.close()
-
-                if not contacts:
-                    break
-
-                for link in contacts:
-                    await broker.publish(
-                        {
-                            "campaign_id": campaign_id,
-                            "link_id": str(link.id),
-                            "contact_id": str(link.contact_id),
-                        },
-                        subject=f"campaigns.send.{campaign_id}",
-                        stream="campaigns",
-                    )
-                offset += len(contacts)
+            offset = await _publish_sendable_contacts(campaign_id, "start")
 
             logger.info(f"Campaign started. Tasks published: {offset}")
             # Start pull-based consumer for this campaign
@@ -274,48 +358,7 @@ async def handle_campaign_resume(
             # Give DB time to propagate status change to other sessions
             await asyncio.sleep(0.5)
 
-            batch_size = 100
-            offset = 0
-            while True:
-                # Stop publishing if campaign is no longer RUNNING
-                async with async_session_maker() as check_session:
-                    try:
-                        campaigns_repo = CampaignRepository(check_session)
-                        campaign = await campaigns_repo.get_by_id(UUID(campaign_id))
-                        should_stop = not campaign or campaign.status != CampaignStatus.RUNNING
-                    finally:
-                        await check_session.close()
-
-                    if should_stop:
-                        logger.info(
-                            f"Halting resume publish; campaign status={campaign.status if campaign else 'unknown'}"
-                        )
-                        break
-
-                # Get remaining QUEUED contacts
-                async with async_session_maker() as session:
-                    try:
-                        repo = CampaignContactRepository(session)
-                        contacts = await repo.get_sendable_contacts(
-                            UUID(campaign_id), limit=batch_size, offset=offset
-                        )
-                    finally:
-                        await session.close()
-
-                if not contacts:
-                    break
-
-                for link in contacts:
-                    await broker.publish(
-                        {
-                            "campaign_id": campaign_id,
-                            "link_id": str(link.id),
-                            "contact_id": str(link.contact_id),
-                        },
-                        subject=f"campaigns.send.{campaign_id}",
-                        stream="campaigns",
-                    )
-                offset += len(contacts)
+            offset = await _publish_sendable_contacts(campaign_id, "resume")
 
             logger.info(f"Campaign resumed. Tasks published: {offset}")
             # Start or restart pull-based consumer for this campaign
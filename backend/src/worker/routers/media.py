@@ -1,5 +1,5 @@
-import mimetypes
 import os
+import secrets
 import uuid
 
 import aiofiles
@@ -11,21 +11,34 @@ from src.clients.meta import MetaClient
 from src.core.config import settings
 from src.repositories.message import MessageRepository
 from src.schemas.messages import MediaDownloadRequest, MediaSendRequest
-from src.services.media.storage import AsyncIteratorFile, StorageService
+from src.services.media.storage import (
+    AsyncIteratorFile,
+    STREAM_CHUNK_SIZE,
+    StorageService,
+    guess_extension,
+)
 from src.services.messaging.sender import MessageSenderService
 from src.services.notifications.service import NotificationService
-from src.worker.dependencies import get_session, get_worker_meta_client, limiter, logger
+from src.worker.dependencies import (
+    get_session,
+    get_storage_service,
+    get_worker_meta_client,
+    limiter,
+    logger,
+)
 
 router = NatsRouter()
 
 
-@router.subscriber("media.download")
+@router.subscriber(
+    "media.download", max_workers=settings.MEDIA_DOWNLOAD_CONCURRENCY
+)
 async def handle_media_download_task(
     task: MediaDownloadRequest,
     session: AsyncSession = Depends(get_session),
     meta_client: MetaClient = Depends(get_worker_meta_client),
+    storage_service: StorageService = Depends(get_storage_service),
 ):
-    storage_service = StorageService()
     message_repo = MessageRepository(session)
     notifier = NotificationService()
 
@@ -34,25 +47,23 @@ async def handle_media_download_task(
             logger.info(f"Processing media download for {task.message_id}")
 
             media_url = await meta_client.get_media_url(task.meta_media_id)
-            ext = mimetypes.guess_extension(task.mime_type) or ".bin"
-            filename = f"{uuid.uuid4()}{ext}"
+            ext = guess_extension(task.mime_type) or ".bin"
+            filename = f"{secrets.token_urlsafe(16)}{ext}"
             r2_key = f"whatsapp/{task.media_type}s/{filename}"
 
             logger.info(f"Starting stream download: {r2_key}")
-            headers = {"Authorization": f"Bearer {meta_client.token}"}
 
-            async with meta_client.client.stream(
-                "GET", media_url, headers=headers
-            ) as response:
-                response.raise_for_status()
-                file_size = int(response.headers.get("content-length", 0))
-                file_stream = AsyncIteratorFile(response.aiter_bytes())
+            async with meta_client.download_media_file(media_url) as response:
+                file_stream = AsyncIteratorFile(
+                    response.aiter_bytes(STREAM_CHUNK_SIZE)
+                )
 
                 await storage_service.upload_stream(
                     file_stream=file_stream,
                     object_name=r2_key,
                     content_type=task.mime_type,
                 )
+                file_size = file_stream.size
 
             media_file = await message_repo.add_media_file(
                 message_id=uuid.UUID(task.message_id),
@@ -101,9 +112,9 @@ async def handle_media_send_task(
     task: MediaSendRequest,
     session: AsyncSession = Depends(get_session),
     meta_client: MetaClient = Depends(get_worker_meta_client),
+    storage: StorageService = Depends(get_storage_service),
 ):
     async with limiter:
-        storage = StorageService()
         notifier = NotificationService()
         sender = MessageSenderService(session, meta_client, notifier, storage)
         message_repo = MessageRepository(session)
@@ -1,6 +1,7 @@
 from faststream import Depends
 from faststream.nats import NatsRouter
 
+from src.core.config import settings
 from src.schemas import WhatsAppMessage
 from src.services.messaging.sender import MessageSenderService
 from src.worker.dependencies import get_message_sender_service, limiter, logger
@@ -8,7 +9,7 @@ from src.worker.dependencies import get_message_sender_service, limiter, logger
 router = NatsRouter()
 
 
-@router.subscriber("messages.manual_send")
+@router.subscriber("messages.manual_send", max_workers=settings.SEND_WORKERS)
 async def handle_messages_task(
     message: WhatsAppMessage,
     sender_service: MessageSenderService = Depends(get_message_sender_service),
@@ -73,8 +74,6 @@ async def handle_send_scheduled_now(
         logger.info(f"Scheduled message {message_id} will be sent immediately by scheduler")
 
 
-        time.sleep(10) # Placeholder
-         
 @router.subscriber("messages.delete_scheduled")
 async def handle_delete_scheduled(
     data: dict,
@@ -100,7 +99,9 @@ async def handle_delete_scheduled(
         logger.info(f"Deleted scheduled message {message_id}")
 
 
-@router.subscriber("messages.send_scheduled_item")
+@router.subscriber(
+    "messages.send_scheduled_item", max_workers=settings.SEND_WORKERS
+)
 async def handle_send_scheduled_item(
     data: dict,
     sender_service: MessageSenderService = Depends(get_message_sender_service),
@@ -1,29 +1,66 @@
+import re
+
+import orjson
 from faststream import Depends
 from faststream.nats import NatsRouter
+from pydantic import ValidationError
 
-from src.core.database import async_session_maker
-from src.models import WebhookLog
-from src.schemas import MetaWebhookPayload, WabaSyncRequest, WebhookEvent
+from src.core.config import settings
+from src.schemas import MetaWebhookPayload, WabaSyncRequest
+from src.services.messaging.batcher import WebhookBatcher
 from src.services.messaging.processor import MessageProcessorService
 from src.services.sync import SyncService
+from src.services.webhook_log import log_webhook
 from src.worker.dependencies import get_processor_service, get_sync_service, logger
 
 router = NatsRouter()
 
+# Keys process_webhook acts on, as object keys (`"field": "messages"` does not match)
+_ACTIONABLE_KEYS = re.compile(
+    rb'"(?:messages|statuses|message_template_status_update'
+    rb'|phone_number_quality_update|account_review_update)"\s*:\s*[\[{]'
+)
+
+webhook_batcher = WebhookBatcher(
+    max_size=settings.BULK_SIZE, max_wait=settings.BULK_FLUSH_MS / 1000
+)
+
 
-@router.subscriber("webhooks.raw")
+@router.subscriber(
+    "webhooks.raw",
+    max_workers=settings.BULK_SIZE if settings.BULK_RECORDER_ENABLED else 1,
+)
 async def handle_raw_webhook_task(
-    event: dict, processor: MessageProcessorService = Depends(get_processor_service)
+    body: bytes | dict,
+    processor: MessageProcessorService = Depends(get_processor_service),
 ):
-    if isinstance(event, dict):
-        event = WebhookEvent(**event)
+    # Legacy {"payload": {...}} JSON envelope still queued from the previous
+    # release (FastStream decodes it to a dict). Drop after one release.
+    if isinstance(body, dict):
+        if "payload" not in body:
+            logger.error(f"Received unknown webhook envelope: {str(body)[:500]}")
+            return
+        body = orjson.dumps(body["payload"])
+
+    # Echo/no-op deliveries skip pydantic validation entirely
+    if not _ACTIONABLE_KEYS.search(body):
+        logger.debug("Webhook has nothing to process, skipping validation")
+        await log_webhook(body.decode("utf-8"))
+        return
+
+    # Parse and validate in one pass inside pydantic-core (no json.loads + dict walk)
+    try:
+        webhook_payload = MetaWebhookPayload.model_validate_json(body)
+    except ValidationError as e:
+        logger.error(f"Received invalid webhook body: {e} | Body: {body[:500]!r}")
+        return
 
-    async with async_session_maker() as session:
-        session.add(WebhookLog(payload=event.payload))
-        await session.commit()
+    await log_webhook(body.decode("utf-8"))
 
-    webhook_payload = MetaWebhookPayload(**event.payload)
-    await processor.process_webhook(webhook_payload)
+    if settings.BULK_RECORDER_ENABLED:
+        await webhook_batcher.submit(webhook_payload, processor)
+    else:
+        await processor.process_webhook(webhook_payload)
 
 
 @router.subscriber("sync.account_data")
@@ -9,28 +9,51 @@ from src.services.campaign.lifecycle import CampaignLifecycleManager
 from src.services.notifications.service import NotificationService
 from src.worker.dependencies import logger
 
+CAMPAIGN_CHECK_INTERVAL = 60  # seconds
+
+
+async def _trigger_campaign_start(broker, campaign_id):
+    logger.info(f"Triggering scheduled campaign: {campaign_id}")
+    try:
+        await broker.publish(
+            str(campaign_id),
+            subject="campaigns.start",
+            stream="campaigns",
+        )
+    except Exception as e:
+        logger.error(f"Failed to trigger scheduled campaign {campaign_id}: {e}")
+
 
 async def scheduled_campaigns_checker(broker):
-    """Background task that checks for scheduled campaigns every minute"""
+    """
+    Background task that checks for scheduled campaigns every minute,
+    or earlier when the next scheduled campaign is due sooner.
+    """
     logger.info("Scheduled campaigns checker started")
+    delay = CAMPAIGN_CHECK_INTERVAL
     while True:
         try:
-            await asyncio.sleep(60)
+            await asyncio.sleep(delay)
+            delay = CAMPAIGN_CHECK_INTERVAL
             logger.debug("Checking for scheduled campaigns...")
             now = get_utc_now()
             async with async_session_maker() as session:
                 campaigns_repo = CampaignRepository(session)
 
                 # Check for scheduled campaigns to start
-                campaigns = await campaigns_repo.get_scheduled_campaigns(now)
-                for campaign in campaigns:
-                    logger.info(
-                        f"Triggering scheduled campaign: {campaign.id}")
-                    await broker.publish(
-                        str(campaign.id),
-                        subject="campaigns.start",
-                        stream="campaigns",
+                campaigns, next_at = await campaigns_repo.get_scheduled_campaigns(now)
+                # Publish all due starts concurrently; failures stay per campaign
+                await asyncio.gather(
+                    *(
+                        _trigger_campaign_start(broker, campaign.id)
+                        for campaign in campaigns
                     )
+                )
+
+                # Wake up right when the next scheduled campaign is due
+                if next_at:
+                    due_in = (next_at - get_utc_now()).total_seconds()
+                    delay = min(CAMPAIGN_CHECK_INTERVAL, max(1.0, due_in))
 
                 # Check for running/paused campaigns that might need completion
                 running_campaigns = await campaigns_repo.list_basic(CampaignStatus.RUNNING)